@@ -16,14 +16,52 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from krita import DockWidgetFactory, DockWidgetFactoryBase
-from .hclsliders import HCLSliders
+import builtins
+import importlib.util
+import sys
+
+# the package only registers the docker, it exports nothing
+__all__ = ()
 
 DOCKER_ID = 'pykrita_hclsliders'
 
-instance = Krita.instance()
-dock_widget_factory = DockWidgetFactory(DOCKER_ID,
-                                        DockWidgetFactoryBase.DockRight,
-                                        HCLSliders)
 
-instance.addDockWidgetFactory(dock_widget_factory)
+def lazyModule(name):
+    # the module is only executed on first attribute access
+    spec = importlib.util.find_spec(name, __name__)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    loader.exec_module(module)
+    return module
+
+
+docker = lazyModule('.hclsliders')
+
+
+def createDocker():
+    return docker.HCLSliders()
+
+
+def __getattr__(name):
+    # resolve the docker class on first access instead of at plugin load
+    if name == 'HCLSliders':
+        return docker.HCLSliders
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def registerDocker():
+    # factories have to be added before krita builds its main window,
+    # deferring this to the event loop would leave the docker out
+    from krita import DockWidgetFactory, DockWidgetFactoryBase
+    Krita.instance().addDockWidgetFactory(
+        DockWidgetFactory(DOCKER_ID, DockWidgetFactoryBase.DockRight,
+                          createDocker))
+
+
+# skip registration outside krita, and only register once when the
+# package is reloaded
+if hasattr(builtins, 'Krita') and not globals().get('registered', False):
+    registerDocker()
+    registered = True
@@ -53,7 +53,10 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math, sys
+import functools, math, sys
+from bisect import bisect
+# bound at module level so hot paths skip the attribute lookup on math
+from math import atan2, cos, degrees, hypot, pi, radians, sin, sqrt, trunc
 # luma coefficents for ITU-R BT.709
 Y709R = 0.2126
 Y709G = 0.7152
@@ -62,26 +65,66 @@ Y709B = 0.0722
 ALPHA = 0.055
 GAMMA = 2.4
 PHI = 12.92
+CHI = 0.04045
+# round(CHI / PHI, 7)
+CHI_LINEAR = 0.0031308
+# precomputed so transfer functions do not evaluate them per component
+ALPHA1 = 1 + ALPHA
+GAMMA_INV = 1 / GAMMA
 # toe functions
 K1 = 0.206
 K2 = 0.03
 K3 = (1.0 + K1) / (1.0 + K2)
+# okhsl saturation at which chroma reaches C_mid and its reciprocal
+MID = 0.8
+MID_INV = 1.25
+# (1 - MID) * MID_INV * MID_INV, shared by both okhsl directions
+MID_K1 = (1 - MID) * MID_INV * MID_INV
+# index into (max, med, min) for R, G and B in each 60deg hue sector
+HUE_SECTORS = (
+    (0, 1, 2), # between red and yellow
+    (1, 0, 2), # between yellow and green
+    (2, 0, 1), # between green and cyan
+    (2, 1, 0), # between cyan and blue
+    (1, 2, 0), # between blue and magenta
+    (0, 2, 1), # between magenta and red
+)
+# luma coefficients of max(R,G,B) and med(R,G,B) in each 60deg hue sector
+HUE_LUMA = (
+    (Y709R, Y709G), # between red and yellow, ranges from 0.2126 to 0.9278
+    (Y709G, Y709R), # between yellow and green, ranges from 0.9278 to 0.7152
+    (Y709G, Y709B), # between green and cyan, ranges from 0.7152 to 0.7874
+    (Y709B, Y709G), # between cyan and blue, ranges from 0.7874 to 0.0722
+    (Y709B, Y709R), # between blue and magenta, ranges from 0.0722 to 0.2848
+    (Y709R, Y709B), # between magenta and red, ranges from 0.2848 to 0.2126
+)
+# gamut intersection jumps for hues in between these parts of blue, so they snap to the upper one
+BLUE_JUMP_LO = 264.052
+BLUE_JUMP_HI = 264.06
+# stands in for infinity when a gamut intersection is not ahead
+FLOAT_MAX = sys.float_info.max
+
+# math.cbrt is only available from python 3.11
+if hasattr(math, "cbrt"):
+    cbrt = math.cbrt
+else:
+    def cbrt(x: float):
+        return math.copysign(abs(x) ** (1 / 3), x)
 
 
 class Convert:
 
     @staticmethod
     def roundZero(n: float, d: int):
-        s = -1 if n < 0 else 1
         if not isinstance(d, int):
             raise TypeError("decimal places must be an integer")
         elif d < 0:
             raise ValueError("decimal places has to be 0 or more")
         elif d == 0:
-            return math.floor(abs(n)) * s
-        
+            return trunc(n)
+        # truncating rounds towards zero for both signs
         f = 10 ** d
-        return math.floor(abs(n) * f) / f * s
+        return trunc(n * f) / f
     
     @staticmethod
     def clampF(f: float, u: float=1, l: float=0):
@@ -95,28 +138,26 @@ class Convert:
 
     @staticmethod
     def componentToSRGB(c: float):
-        # round(CHI / PHI, 7) = 0.0031308
-        return (1 + ALPHA) * c ** (1 / GAMMA) - ALPHA if c > 0.0031308 else c * PHI
+        return ALPHA1 * c ** GAMMA_INV - ALPHA if c > CHI_LINEAR else c * PHI
 
     @staticmethod
     def componentToLinear(c: float):
-        # CHI = 0.04045
-        return ((c + ALPHA) / (1 + ALPHA)) ** GAMMA if c > 0.04045 else c / PHI
+        return ((c + ALPHA) / ALPHA1) ** GAMMA if c > CHI else c / PHI
 
     @staticmethod
     def cartesianToPolar(a: float, b: float):
-        c = math.hypot(a, b)
-        hRad = math.atan2(b, a)
+        c = hypot(a, b)
+        hRad = atan2(b, a)
         if hRad < 0:
-            hRad += math.pi * 2
-        h = math.degrees(hRad)
+            hRad += pi * 2
+        h = degrees(hRad)
         return (c, h)
     
     @staticmethod
     def polarToCartesian(c: float, h: float):
-        hRad = math.radians(h)
-        a = c * math.cos(hRad)
-        b = c * math.sin(hRad)
+        hRad = radians(h)
+        a = c * cos(hRad)
+        b = c * sin(hRad)
         return (a, b)
     
     @staticmethod
@@ -126,9 +167,9 @@ class Convert:
         m = 0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b
         s = 0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b
         # apply non-linearity
-        l_ = l ** (1 / 3)
-        m_ = m ** (1 / 3)
-        s_ = s ** (1 / 3)
+        l_ = cbrt(l)
+        m_ = cbrt(m)
+        s_ = cbrt(s)
         # transform to Lab coordinates
         okL = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
         okA = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
@@ -154,7 +195,7 @@ class Convert:
     @staticmethod
     # toe function for L_r
     def toe(x):
-        return 0.5 * (K3 * x - K1 + ((K3 * x - K1) * (K3 * x - K1) + 4 * K2 * K3 * x) ** (1 / 2))
+        return 0.5 * (K3 * x - K1 + sqrt((K3 * x - K1) * (K3 * x - K1) + 4 * K2 * K3 * x))
     
     @staticmethod
     # inverse toe function for L_r
@@ -168,15 +209,6 @@ class Convert:
     def computeMaxSaturation(a: float, b: float):
         # Max saturation will be when one of r, g or b goes below zero.
         # Select different coefficients depending on which component goes below zero first
-        # Blue component
-        k0 = +1.35733652
-        k1 = -0.00915799 
-        k2 = -1.15130210 
-        k3 = -0.50559606 
-        k4 = +0.00692167
-        wl = -0.0041960863 
-        wm = -0.7034186147 
-        ws = +1.7076147010
         if -1.88170328 * a - 0.80936493 * b > 1:
             # Red component
             k0 = +1.19086277 
@@ -197,6 +229,16 @@ class Convert:
             wl = -1.2684380046 
             wm = +2.6097574011 
             ws = -0.3413193965
+        else:
+            # Blue component
+            k0 = +1.35733652
+            k1 = -0.00915799 
+            k2 = -1.15130210 
+            k3 = -0.50559606 
+            k4 = +0.00692167
+            wl = -0.0041960863 
+            wm = -0.7034186147 
+            ws = +1.7076147010
         # Approximate max saturation using a polynomial:
         maxS = k0 + k1 * a + k2 * b + k3 * a * a + k4 * a * b
         # Do one step Halley's method to get closer
@@ -231,14 +273,17 @@ class Convert:
         return maxS
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     # finds L_cusp and C_cusp for a given hue
     # a and b must be normalized so a^2 + b^2 == 1
+    # cached as the cusp only depends on hue and sliders reuse the same hues
     def findCuspLC(a: float, b: float):
         # First, find the maximum saturation (saturation S = C/L)
         maxS = Convert.computeMaxSaturation(a, b)
         # Convert to linear sRGB to find the first point where at least one of r,g or b >= 1:
-        maxRgb = Convert.oklabToLinear(1, maxS * a, maxS * b)
-        cuspL = (1.0 / max(maxRgb[0], maxRgb[1], maxRgb[2])) ** (1 / 3)
+        r, g, b = Convert.oklabToLinear(1, maxS * a, maxS * b)
+        rgbMax = r if r > g else g
+        cuspL = cbrt(1.0 / (rgbMax if rgbMax > b else b))
         cuspC = cuspL * maxS
         return (cuspL, cuspC)
     
@@ -251,14 +296,15 @@ class Convert:
         # Find the cusp of the gamut triangle
         if cuspLC is None:
             cuspLC = Convert.findCuspLC(a, b)
+        cuspL, cuspC = cuspLC
         # Find the intersection for upper and lower half separately
-        if ((l1 - l0) * cuspLC[1] - (cuspLC[0] - l1) * c1) <= 0.0:
+        if ((l1 - l0) * cuspC - (cuspL - l1) * c1) <= 0.0:
             # Lower half
-            t = cuspLC[1] * l0 / (c1 * cuspLC[0] + cuspLC[1] * (l0 - l1))
+            t = cuspC * l0 / (c1 * cuspL + cuspC * (l0 - l1))
         else:
             # Upper half
             # First intersect with triangle
-            t = cuspLC[1] * (l0 - 1.0) / (c1 * (cuspLC[0] - 1.0) + cuspLC[1] * (l0 - l1))
+            t = cuspC * (l0 - 1.0) / (c1 * (cuspL - 1.0) + cuspC * (l0 - l1))
             # Then one step Halley's method
             dL = l1 - l0
             dC = c1
@@ -296,25 +342,21 @@ class Convert:
             r2 = 4.0767416621 * ldt2 - 3.3077115913 * mdt2 + 0.2309699292 * sdt2
 
             u_r = r1 / (r1 * r1 - 0.5 * r * r2)
-            t_r = -r * u_r
+            t_r = -r * u_r if u_r >= 0.0 else FLOAT_MAX
 
             g = -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s - 1
             g1 = -1.2684380046 * ldt + 2.6097574011 * mdt - 0.3413193965 * sdt
             g2 = -1.2684380046 * ldt2 + 2.6097574011 * mdt2 - 0.3413193965 * sdt2
 
             u_g = g1 / (g1 * g1 - 0.5 * g * g2)
-            t_g = -g * u_g
+            t_g = -g * u_g if u_g >= 0.0 else FLOAT_MAX
 
             b = -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s - 1
             b1 = -0.0041960863 * ldt - 0.7034186147 * mdt + 1.7076147010 * sdt
             b2 = -0.0041960863 * ldt2 - 0.7034186147 * mdt2 + 1.7076147010 * sdt2
 
             u_b = b1 / (b1 * b1 - 0.5 * b * b2)
-            t_b = -b * u_b
-
-            t_r = t_r if u_r >= 0.0 else sys.float_info.max
-            t_g = t_g if u_g >= 0.0 else sys.float_info.max
-            t_b = t_b if u_b >= 0.0 else sys.float_info.max
+            t_b = -b * u_b if u_b >= 0.0 else FLOAT_MAX
 
             t += min(t_r, t_g, t_b)
         
@@ -330,6 +372,7 @@ class Convert:
     # This polynomial was created by an optimization process
     # It has been designed so that S_mid < S_max and T_mid < T_max
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def getMidST(a_: float, b_: float):
         s = 0.11516993 + 1.0 / (+7.44778970 + 4.15901240 * b_
             + a_ * (-2.19557347 + 1.75198401 * b_
@@ -353,23 +396,24 @@ class Convert:
         midST = Convert.getMidST(a_, b_)
         # Use a soft minimum function, 
         # instead of a sharp triangle shape to get a smooth value for chroma.
-        cMid = 0.9 * k * (1 / (1 / (l * midST[0]) ** 4 + 1 / ((1 - l) * midST[1]) ** 4)) ** (1 / 4)
+        cMid = 0.9 * k * sqrt(sqrt(1 / (1 / (l * midST[0]) ** 4 + 1 / ((1 - l) * midST[1]) ** 4)))
         # for C_0, the shape is independent of hue, so ST are constant. 
         # Values picked to roughly be the average values of ST.
-        c0 = (1 / (1 / (l * 0.4) ** 2 + 1 / ((1 - l) * 0.8) ** 2)) ** (1 / 2)
+        c0 = sqrt(1 / (1 / (l * 0.4) ** 2 + 1 / ((1 - l) * 0.8) ** 2))
         return (c0, cMid, cMax)
     
     @staticmethod
     def rgbToTRC(rgb: tuple, trc: str):
+        r, g, b = rgb
         if trc == "sRGB":
-            r = Convert.clampF(Convert.componentToSRGB(rgb[0]))
-            g = Convert.clampF(Convert.componentToSRGB(rgb[1]))
-            b = Convert.clampF(Convert.componentToSRGB(rgb[2]))
+            r = Convert.clampF(Convert.componentToSRGB(r))
+            g = Convert.clampF(Convert.componentToSRGB(g))
+            b = Convert.clampF(Convert.componentToSRGB(b))
             return (r, g, b)
         else:
-            r = Convert.componentToLinear(rgb[0])
-            g = Convert.componentToLinear(rgb[1])
-            b = Convert.componentToLinear(rgb[2])
+            r = Convert.componentToLinear(r)
+            g = Convert.componentToLinear(g)
+            b = Convert.componentToLinear(b)
             return (r, g, b)
     
     @staticmethod
@@ -379,20 +423,22 @@ class Convert:
             g = int(g * 255)
             b = int(b * 255)
         else:
-            r = round(Convert.componentToSRGB(r) * 255)
-            g = round(Convert.componentToSRGB(g) * 255)
-            b = round(Convert.componentToSRGB(b) * 255)
+            # count the rounding thresholds below each component instead of encoding it
+            r = bisect(SRGB8_THRESHOLDS, r)
+            g = bisect(SRGB8_THRESHOLDS, g)
+            b = bisect(SRGB8_THRESHOLDS, b)
         return (r, g, b)
     
+    @staticmethod
+    def srgbFToInt8(r: float, g: float, b: float):
+        # rounds sRGB components to the same 8 bits rgbFToInt8 gives for their linear values
+        return (bisect(SRGB8_HALFWAYS, r), bisect(SRGB8_HALFWAYS, g), bisect(SRGB8_HALFWAYS, b))
+
     @staticmethod
     def rgbFToHexS(r: float, g: float, b: float, trc: str):
         # hex codes are in 8 bits per color
-        rgb = Convert.rgbFToInt8(r, g, b, trc)
-        # hex converts int to str with first 2 char being 0x
-        r = hex(rgb[0])[2:].zfill(2).upper()
-        g = hex(rgb[1])[2:].zfill(2).upper()
-        b = hex(rgb[2])[2:].zfill(2).upper()
-        return f"#{r}{g}{b}"
+        r, g, b = Convert.rgbFToInt8(r, g, b, trc)
+        return f"#{r:02X}{g:02X}{b:02X}"
     
     @staticmethod
     def hexSToRgbF(syntax: str, trc: str):
@@ -400,19 +446,14 @@ class Convert:
             print("Invalid syntax")
             return
         try:
-            r = int(syntax[1:3], 16) / 255.0
-            g = int(syntax[3:5], 16) / 255.0
-            b = int(syntax[5:7], 16) / 255.0
+            r, g, b = bytes.fromhex(syntax[1:])
         except ValueError:
             print("Invalid syntax")
             return
-        
         if trc == "sRGB":
-            return (r, g, b)
-        r = Convert.componentToLinear(r)
-        g = Convert.componentToLinear(g)
-        b = Convert.componentToLinear(b)
-        return (r, g, b)
+            return (r / 255.0, g / 255.0, b / 255.0)
+        # 8 bit components are looked up instead of running the transfer function
+        return (SRGB8_TO_LINEAR[r], SRGB8_TO_LINEAR[g], SRGB8_TO_LINEAR[b])
     
     @staticmethod
     def rgbFToOklabS(r: float, g: float, b: float, trc: str):
@@ -421,11 +462,11 @@ class Convert:
             r = Convert.componentToLinear(r)
             g = Convert.componentToLinear(g)
             b = Convert.componentToLinear(b)
-        oklab = Convert.linearToOklab(r, g, b)
+        okL, okA, okB = Convert.linearToOklab(r, g, b)
         # l in percentage, a and b is 0 to 0.3+
-        okL = round(oklab[0] * 100, 2)
-        okA = Convert.roundZero(oklab[1], 4)
-        okB = Convert.roundZero(oklab[2], 4)
+        okL = round(okL * 100, 2)
+        okA = Convert.roundZero(okA, 4)
+        okB = Convert.roundZero(okB, 4)
         return f"oklab({okL}% {okA} {okB})"
     
     @staticmethod
@@ -453,11 +494,12 @@ class Convert:
         except ValueError:
             print("Invalid syntax")
             return
-        rgb = Convert.oklabToLinear(okL, okA, okB)
+        r, g, b = Convert.oklabToLinear(okL, okA, okB)
         # if rgb not linear, perform transfer functions for components
-        r = Convert.componentToSRGB(rgb[0]) if trc == "sRGB" else rgb[0]
-        g = Convert.componentToSRGB(rgb[1]) if trc == "sRGB" else rgb[1]
-        b = Convert.componentToSRGB(rgb[2]) if trc == "sRGB" else rgb[2]
+        if trc == "sRGB":
+            r = Convert.componentToSRGB(r)
+            g = Convert.componentToSRGB(g)
+            b = Convert.componentToSRGB(b)
         return (Convert.clampF(r), Convert.clampF(g), Convert.clampF(b))
     
     @staticmethod
@@ -467,21 +509,25 @@ class Convert:
             r = Convert.componentToLinear(r)
             g = Convert.componentToLinear(g)
             b = Convert.componentToLinear(b)
-        oklab = Convert.linearToOklab(r, g, b)
-        l = round(oklab[0] * 100, 2)
-        ch = Convert.cartesianToPolar(oklab[1], oklab[2])
-        c = ch[0]
+        l, okA, okB = Convert.linearToOklab(r, g, b)
+        l = round(l * 100, 2)
+        c = hypot(okA, okB)
         h = 0
         # chroma of neutral colors will not be exactly 0 due to floating point errors
         if c < 0.000001:
             c = 0
         else:
+            # hue is only needed for colors that are not neutral
+            hRad = atan2(okB, okA)
+            if hRad < 0:
+                hRad += pi * 2
+            h = degrees(hRad)
             # chroma adjustment due to rounding up blue hue
-            if 264.052 < ch[1] < 264.06:
-                h = 264.06
+            if BLUE_JUMP_LO < h < BLUE_JUMP_HI:
+                h = BLUE_JUMP_HI
                 c = round(c - 0.0001, 4)
             else:
-                h = round(ch[1], 2)
+                h = round(h, 2)
                 c = Convert.roundZero(c, 4)
         # l in percentage, c is 0 to 0.3+, h in degrees
         return f"oklch({l}% {c} {h})"
@@ -509,45 +555,29 @@ class Convert:
             print("Invalid syntax")
             return
         # clip chroma if exceed sRGB gamut
-        ab = Convert.polarToCartesian(1, h)
+        hRad = radians(h)
+        a_ = cos(hRad)
+        b_ = sin(hRad)
         if c:
-            u = Convert.findGamutIntersection(*ab, l, 1, l)
+            u = Convert.findGamutIntersection(a_, b_, l, 1, l)
             if c > u:
                 c = u
-        rgb = Convert.oklabToLinear(l, ab[0] * c, ab[1] * c)
+        r, g, b = Convert.oklabToLinear(l, a_ * c, b_ * c)
         # if rgb not linear, perform transfer functions for components
-        r = Convert.componentToSRGB(rgb[0]) if trc == "sRGB" else rgb[0]
-        g = Convert.componentToSRGB(rgb[1]) if trc == "sRGB" else rgb[1]
-        b = Convert.componentToSRGB(rgb[2]) if trc == "sRGB" else rgb[2]
+        if trc == "sRGB":
+            r = Convert.componentToSRGB(r)
+            g = Convert.componentToSRGB(g)
+            b = Convert.componentToSRGB(b)
         return (Convert.clampF(r), Convert.clampF(g), Convert.clampF(b))
     
     @staticmethod
     def hSectorToRgbF(hSector: float, v: float, m: float, x: float, trc: str="sRGB"):
         # assign max, med and min according to hue sector
-        if hSector == 1: # between yellow and green
-            r = x
-            g = v
-            b = m
-        elif hSector == 2: # between green and cyan
-            r = m
-            g = v
-            b = x
-        elif hSector == 3: # between cyan and blue
-            r = m
-            g = x
-            b = v
-        elif hSector == 4: # between blue and magenta
-            r = x
-            g = m
-            b = v
-        elif hSector == 5: # between magenta and red
-            r = v
-            g = m
-            b = x
-        else: # between red and yellow
-            r = v
-            g = x
-            b = m
+        rgb = (v, x, m)
+        i, j, k = HUE_SECTORS[hSector % 6]
+        r = rgb[i]
+        g = rgb[j]
+        b = rgb[k]
         # convert to linear if not sRGB
         if trc == "sRGB":
             return (r, g, b)
@@ -564,8 +594,10 @@ class Convert:
             g = Convert.componentToSRGB(g)
             b = Convert.componentToSRGB(b)
         # value is equal to max(R,G,B) while min(R,G,B) determines saturation
-        v = max(r,g,b)
-        m = min(r,g,b)
+        v = r if r > g else g
+        v = v if v > b else b
+        m = r if r < g else g
+        m = m if m < b else b
         # chroma is the colorfulness of the color compared to the neutral color of equal value
         c = v - m
         if c == 0:
@@ -583,7 +615,7 @@ class Convert:
         elif v == g:
             # green is 2, range of hues that are predominantly green is 1.000... to 2.999...
             h = (b - r) / c + 2
-        elif v == b:
+        else:
             # blue is 4, range of hues that are predominantly blue is 3.000... to 4.999...
             h = (r - g) / c + 4
         # saturation is the ratio of chroma of the color to the maximum chroma of equal value
@@ -609,7 +641,15 @@ class Convert:
         d = h - hSector if hSector % 2 else 1 - (h - hSector)
         # med(R,G,B) = max(R,G,B) - (|deviation| * chroma)
         x = v * (1 - d * s)
-        return Convert.hSectorToRgbF(hSector, v, m, x, trc)
+        # assign max, med and min according to hue sector
+        rgb = (v, x, m)
+        i, j, k = HUE_SECTORS[hSector % 6]
+        if trc == "sRGB":
+            return (rgb[i], rgb[j], rgb[k])
+        # convert to linear if not sRGB
+        return (Convert.componentToLinear(rgb[i]),
+                Convert.componentToLinear(rgb[j]),
+                Convert.componentToLinear(rgb[k]))
     
     @staticmethod
     def rgbFToHsl(r: float, g: float, b: float, trc: str):
@@ -618,8 +658,10 @@ class Convert:
             r = Convert.componentToSRGB(r)
             g = Convert.componentToSRGB(g)
             b = Convert.componentToSRGB(b)
-        v = max(r,g,b)
-        m = min(r,g,b)
+        v = r if r > g else g
+        v = v if v > b else b
+        m = r if r < g else g
+        m = m if m < b else b
         # lightness is defined as the midrange of the RGB components
         l = (v + m) / 2
         c = v - m
@@ -631,7 +673,7 @@ class Convert:
             h = ((g - b) / c) % 6
         elif v == g:
             h = (b - r) / c + 2
-        elif v == b:
+        else:
             h = (r - g) / c + 4
         # saturation = chroma / chroma range
         # max chroma range when lightness at half
@@ -652,7 +694,15 @@ class Convert:
         # calculate deviation from closest secondary color with range of -0.999... to 0.999...
         d = h - hSector if hSector % 2 else 1 - (h - hSector)
         x = v - d * (v - m)
-        return Convert.hSectorToRgbF(hSector, v, m, x, trc)
+        # assign max, med and min according to hue sector
+        rgb = (v, x, m)
+        i, j, k = HUE_SECTORS[hSector % 6]
+        if trc == "sRGB":
+            return (rgb[i], rgb[j], rgb[k])
+        # convert to linear if not sRGB
+        return (Convert.componentToLinear(rgb[i]),
+                Convert.componentToLinear(rgb[j]),
+                Convert.componentToLinear(rgb[k]))
         
     @staticmethod
     def rgbFToHcy(r: float, g: float, b: float, h: float, trc: str, luma: bool):
@@ -663,42 +713,25 @@ class Convert:
             b = Convert.componentToSRGB(b)
         # y can be luma or relative luminance depending on rgb format
         y = Y709R * r + Y709G * g + Y709B * b
-        v = max(r, g, b)
-        m = min(r, g, b)
+        v = r if r > g else g
+        v = v if v > b else b
+        m = r if r < g else g
+        m = m if m < b else b
         c = v - m
-        yHue = 0
         # if color is neutral, use previous hue to calculate luma coefficient of hue
+        if c == 0:
+            h /= 60
+        elif v == g:
+            h = (b - r) / c + 2
+        elif v == b:
+            h = (r - g) / c + 4
+        else:
+            h = ((g - b) / c) % 6
         # max(R,G,B) coefficent + med(R,G,B) coefficient * deviation from max(R,G,B) hue
-        if (c != 0 and v == g) or (c == 0 and 60 <= h <= 180):
-            h = (b - r) / c + 2 if c != 0 else h / 60
-            if 1 <= h <= 2: # between yellow and green
-                d = h - 1
-                # luma coefficient of hue ranges from 0.9278 to 0.7152
-                yHue = Y709G + Y709R * (1 - d)
-            elif 2 < h <= 3: # between green and cyan
-                d = h - 2
-                # luma coefficient of hue ranges from 0.7152 to 0.7874
-                yHue = Y709G + Y709B * d
-        elif (c != 0 and v == b) or (c == 0 and 180 < h <= 300):
-            h = (r - g) / c + 4 if c != 0 else h / 60
-            if 3 < h <= 4: # between cyan and blue
-                d = h - 3
-                # luma coefficient of hue ranges from 0.7874 to 0.0722
-                yHue = Y709B + Y709G * (1 - d)
-            elif 4 < h <= 5: # between blue and magenta
-                d = h - 4
-                # luma coefficient of hue ranges from 0.0722 to 0.2848
-                yHue = Y709B + Y709R * d
-        elif (c != 0 and v == r) or (c == 0 and (h > 300 or h < 60)):
-            h = ((g - b) / c) % 6 if c != 0 else h / 60
-            if 5 < h <= 6: # between magenta and red
-                d = h - 5
-                # luma coefficient of hue ranges from 0.2848 to 0.2126
-                yHue = Y709R + Y709B * (1 - d)
-            elif 0 <= h < 1: # between red and yellow
-                d = h
-                # luma coefficient of hue ranges from 0.2126 to 0.9278
-                yHue = Y709R + Y709G * d
+        hSector = int(h)
+        d = h - hSector if hSector % 2 == 0 else 1 - (h - hSector)
+        yMax, yMed = HUE_LUMA[hSector % 6]
+        yHue = yMax + yMed * d
         # calculate upper limit of chroma for hue and luma pair
         u = y / yHue if y <= yHue else (1 - y) / (1 - yHue)
         return (round(h * 60, 2), round(c * 100, 3), round(y * 100, 2), round(u * 100, 3))
@@ -708,10 +741,8 @@ class Convert:
         # derive hue in 60deg sectors
         h /= 60
         hSector = int(h)
-        # pass in y and u as -1 for max chroma conversions
-        if y != -1:
-            # scale luma to 1
-            y /= 100
+        # scale luma to 1
+        y /= 100
         if c == 0 or y == 0 or y == 1:
             # if y is always luma, convert to linear
             if luma and trc == "linear":
@@ -723,22 +754,8 @@ class Convert:
         # |deviation| = derived hue - hue sector if deviation is positive
         d = h - hSector if hSector % 2 == 0 else 1 - (h - hSector)
         # calculate luma coefficient of hue
-        yHue = 0
-        if hSector == 1: # between yellow and green
-            yHue = Y709G + Y709R * d
-        elif hSector == 2: # between green and cyan
-            yHue = Y709G + Y709B * d
-        elif hSector == 3: # between cyan and blue
-            yHue = Y709B + Y709G * d
-        elif hSector == 4: # between blue and magenta
-            yHue = Y709B + Y709R * d
-        elif hSector == 5: # between magenta and red
-            yHue = Y709R + Y709B * d
-        else: # between red and yellow
-            yHue = Y709R + Y709G * d
-        # when chroma is at maximum, y = luma coefficient of hue
-        if y == -1:
-            y = yHue
+        yMax, yMed = HUE_LUMA[hSector % 6]
+        yHue = yMax + yMed * d
         # it is not always possible for chroma to be constant when adjusting hue or luma
         # adjustment have to either clip chroma or have consistent saturation instead
         cMax = y / yHue if y <= yHue else (1 - y) / (1 - yHue)
@@ -765,38 +782,80 @@ class Convert:
         if luma:
             return Convert.hSectorToRgbF(hSector, v, m, x, trc)
         return Convert.hSectorToRgbF(hSector, v, m, x)
+
+    @staticmethod
+    def hcyMaxChromaToRgbF(h: float, trc: str, luma: bool):
+        # derive hue in 60deg sectors
+        h /= 60
+        hSector = int(h)
+        d = h - hSector if hSector % 2 == 0 else 1 - (h - hSector)
+        # when chroma is at maximum, y = luma coefficient of hue
+        # so max(R,G,B) = 1, min(R,G,B) = 0 and med(R,G,B) = |deviation|
+        if luma:
+            return Convert.hSectorToRgbF(hSector, 1.0, 0.0, d, trc)
+        return Convert.hSectorToRgbF(hSector, 1.0, 0.0, d)
     
     @staticmethod
-    def rgbFToOkhcl(r: float, g: float, b: float, h: float, trc: str):
+    @functools.lru_cache(maxsize=1)
+    # oklab and its chroma and hue, shared by the ok* conversions of the same color
+    def rgbFToOklch(r: float, g: float, b: float, trc: str):
+        # neutral colors have no chroma or hue, and their lightness is the cube root of luminance
+        if r == g == b:
+            return (cbrt(Convert.componentToLinear(r) if trc == "sRGB" else r), 0, 0, 0, 0)
         # if rgb not linear, convert to linear for oklab conversion
         if trc == "sRGB":
             r = Convert.componentToLinear(r)
             g = Convert.componentToLinear(g)
             b = Convert.componentToLinear(b)
-        oklab = Convert.linearToOklab(r, g, b)
-        l = oklab[0]
-        ch = Convert.cartesianToPolar(oklab[1], oklab[2])
-        c = ch[0]
+        # linearToOklab written out, as every ok* conversion passes through here
+        l_ = cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+        m_ = cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+        s_ = cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+        l = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+        okA = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+        okB = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+        c = hypot(okA, okB)
+        # chroma of neutral colors will not be exactly 0 due to floating point errors
+        h = 0
+        if c >= 0.000001:
+            # hue is only needed for colors that are not neutral
+            hRad = atan2(okB, okA)
+            if hRad < 0:
+                hRad += pi * 2
+            h = degrees(hRad)
+            # gamut intersection jumps for parts of blue
+            if BLUE_JUMP_LO < h < BLUE_JUMP_HI:
+                h = BLUE_JUMP_HI
+        return (l, okA, okB, c, h)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    # cached for the last color only
+    def rgbFToOkhcl(r: float, g: float, b: float, h: float, trc: str):
+        l, okA, okB, c, hue = Convert.rgbFToOklch(r, g, b, trc)
         # chroma of neutral colors will not be exactly 0 due to floating point errors
         if c < 0.000001:
             # use current hue to calulate chroma limit in sRGB gamut for neutral colors
-            ab = Convert.polarToCartesian(1, h)
-            cuspLC = Convert.findCuspLC(*ab)
-            u = Convert.findGamutIntersection(*ab, l, 1, l, cuspLC)
+            hRad = radians(h)
+            a_ = cos(hRad)
+            b_ = sin(hRad)
+            cuspLC = Convert.findCuspLC(a_, b_)
+            u = Convert.findGamutIntersection(a_, b_, l, 1, l, cuspLC)
             u /= cuspLC[1]
             c = 0
         else:
-            # gamut intersection jumps for parts of blue
-            h = ch[1] if not 264.052 < ch[1] < 264.06 else 264.06
+            h = hue
             # a and b must be normalized to c = 1 to calculate chroma limit in sRGB gamut
-            a_ = oklab[1] / c
-            b_ = oklab[2] / c
+            a_ = okA / c
+            b_ = okB / c
             cuspLC = Convert.findCuspLC(a_, b_)
             u = Convert.findGamutIntersection(a_, b_, l, 1, l, cuspLC)
             if c > u:
                 c = u
-            u /= cuspLC[1]
-            c /= cuspLC[1]
+            # chroma and its limit are both relative to the cusp
+            cuspInv = 1 / cuspLC[1]
+            u *= cuspInv
+            c *= cuspInv
         l = Convert.toe(l)
         return (round(h, 2), round(c * 100, 3), round(l * 100, 2), round(u * 100, 3))
     
@@ -805,46 +864,45 @@ class Convert:
         # convert lref back to okL
         l = Convert.toeInv(l / 100)
         # clip chroma if exceed sRGB gamut
-        ab = (0, 0)
+        okA = okB = 0
         if c:
-            ab = Convert.polarToCartesian(1, h)
-            cuspLC = Convert.findCuspLC(*ab)
-            cMax = Convert.findGamutIntersection(*ab, l, 1, l, cuspLC)
+            hRad = radians(h)
+            a_ = cos(hRad)
+            b_ = sin(hRad)
+            cuspLC = Convert.findCuspLC(a_, b_)
+            cMax = Convert.findGamutIntersection(a_, b_, l, 1, l, cuspLC)
             if u == -1:
                 c = c / 100 * cuspLC[1]
                 if c > cMax:
                     c = cMax
             else:
-                s = c / u
+                # scale chroma to hue or lightness adjustment
+                s = 0
+                if u:
+                    s = c / u
                 c = s * cMax
-            ab = Convert.polarToCartesian(c, h)
-        rgb = Convert.oklabToLinear(l, *ab)
+            okA = c * a_
+            okB = c * b_
+        r, g, b = Convert.oklabToLinear(l, okA, okB)
         # perform transfer functions for components if output to sRGB
-        r = Convert.componentToSRGB(rgb[0]) if trc == "sRGB" else rgb[0]
-        g = Convert.componentToSRGB(rgb[1]) if trc == "sRGB" else rgb[1]
-        b = Convert.componentToSRGB(rgb[2]) if trc == "sRGB" else rgb[2]
+        if trc == "sRGB":
+            r = Convert.componentToSRGB(r)
+            g = Convert.componentToSRGB(g)
+            b = Convert.componentToSRGB(b)
         return (Convert.clampF(r), Convert.clampF(g), Convert.clampF(b))
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
+    # cached for the last color only
     def rgbFToOkhsv(r: float, g: float, b: float, trc: str):
-        # if rgb not linear, convert to linear for oklab conversion
-        if trc == "sRGB":
-            r = Convert.componentToLinear(r)
-            g = Convert.componentToLinear(g)
-            b = Convert.componentToLinear(b)
-        oklab = Convert.linearToOklab(r, g, b)
-        l = oklab[0]
-        ch = Convert.cartesianToPolar(oklab[1], oklab[2])
-        c = ch[0]
+        l, okA, okB, c, h = Convert.rgbFToOklch(r, g, b, trc)
         # chroma of neutral colors will not be exactly 0 due to floating point errors
         if c < 0.000001:
             return (0, 0, round(Convert.toe(l) * 100, 2))
         else:
-            # gamut intersection jumps for parts of blue
-            h = ch[1] if not 264.052 < ch[1] < 264.06 else 264.06
             # a and b must be normalized to c = 1 to calculate chroma limit in sRGB gamut
-            a_ = oklab[1] / c
-            b_ = oklab[2] / c
+            a_ = okA / c
+            b_ = okB / c
             cuspLC = Convert.findCuspLC(a_, b_)
             st = Convert.cuspToST(cuspLC)
             sMax = st[0]
@@ -859,12 +917,13 @@ class Convert:
             c_vt = c_v * l_vt / l_v
             # we can then use these to invert the step that compensates for the toe 
             # and the curved top part of the triangle:
-            rgbScale = Convert.oklabToLinear(l_vt, a_ * c_vt, b_ * c_vt)
-            scaleL = (1 / max(rgbScale[0], rgbScale[1], rgbScale[2])) ** (1 / 3)
+            r, g, b = Convert.oklabToLinear(l_vt, a_ * c_vt, b_ * c_vt)
+            rgbMax = r if r > g else g
+            scaleL = cbrt(1 / (rgbMax if rgbMax > b else b))
             l = Convert.toe(l / scaleL)
             # // we can now compute v and s:
             v = l / l_v
-            s = (s0 + tMax) * c_v / ((tMax * s0) + tMax * k * c_v)
+            s = (s0 + tMax) * c_v / (tMax * (s0 + k * c_v))
             if s > 1:
                 s = 1.0
             return (round(h, 2), round(s * 100, 2), round(v * 100, 2))
@@ -874,14 +933,15 @@ class Convert:
         # scale saturation and value range from 0-100 to 0-1
         s /= 100
         v /= 100
-        rgb = None
         if v == 0:
             return (0, 0, 0)
         elif s == 0:
-            rgb = Convert.oklabToLinear(Convert.toeInv(v), 0, 0)
+            r, g, b = Convert.oklabToLinear(Convert.toeInv(v), 0, 0)
         else:
-            ab = Convert.polarToCartesian(1, h)
-            cuspLC = Convert.findCuspLC(*ab)
+            hRad = radians(h)
+            a_ = cos(hRad)
+            b_ = sin(hRad)
+            cuspLC = Convert.findCuspLC(a_, b_)
             st = Convert.cuspToST(cuspLC)
             sMax = st[0]
             tMax = st[1]
@@ -889,8 +949,9 @@ class Convert:
             k = 1 - s0 / sMax
             # first we compute L and V as if the gamut is a perfect triangle:
             # L, C when v==1:
-            l_v = 1 - s * s0 / (s0 + tMax - tMax * k * s)
-            c_v = s * tMax * s0 / (s0 + tMax - tMax * k * s)
+            denom = s0 + tMax - tMax * k * s
+            l_v = 1 - s * s0 / denom
+            c_v = s * tMax * s0 / denom
             l = v * l_v
             c = v * c_v
             # then we compensate for both toe and the curved top part of the triangle:
@@ -899,52 +960,45 @@ class Convert:
             l_new = Convert.toeInv(l)
             c *= l_new / l
             l = l_new
-            rgbScale = Convert.oklabToLinear(l_vt, ab[0] * c_vt, ab[1] * c_vt)
-            scaleL = (1 / max(rgbScale[0], rgbScale[1], rgbScale[2])) ** (1 / 3)
+            r, g, b = Convert.oklabToLinear(l_vt, a_ * c_vt, b_ * c_vt)
+            rgbMax = r if r > g else g
+            scaleL = cbrt(1 / (rgbMax if rgbMax > b else b))
             l *= scaleL
             c *= scaleL
-            rgb = Convert.oklabToLinear(l, ab[0] * c, ab[1] * c)
+            r, g, b = Convert.oklabToLinear(l, a_ * c, b_ * c)
         # perform transfer functions for components if output to sRGB
-        r = Convert.componentToSRGB(rgb[0]) if trc == "sRGB" else rgb[0]
-        g = Convert.componentToSRGB(rgb[1]) if trc == "sRGB" else rgb[1]
-        b = Convert.componentToSRGB(rgb[2]) if trc == "sRGB" else rgb[2]
+        if trc == "sRGB":
+            r = Convert.componentToSRGB(r)
+            g = Convert.componentToSRGB(g)
+            b = Convert.componentToSRGB(b)
         return (Convert.clampF(r), Convert.clampF(g), Convert.clampF(b))
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
+    # cached for the last color only
     def rgbFToOkhsl(r: float, g: float, b: float, trc: str):
-        # if rgb not linear, convert to linear for oklab conversion
-        if trc == "sRGB":
-            r = Convert.componentToLinear(r)
-            g = Convert.componentToLinear(g)
-            b = Convert.componentToLinear(b)
-        oklab = Convert.linearToOklab(r, g, b)
-        l = oklab[0]
-        ch = Convert.cartesianToPolar(oklab[1], oklab[2])
+        l, okA, okB, c, h = Convert.rgbFToOklch(r, g, b, trc)
         s = 0
-        c = ch[0]
         # chroma of neutral colors will not be exactly 0 due to floating point errors
         if c >= 0.000001:
-            a_ = oklab[1] / c
-            b_ = oklab[2] / c
+            a_ = okA / c
+            b_ = okB / c
             cs = Convert.getCs(l, a_, b_)
             c0 = cs[0]
             cMid = cs[1]
             cMax = cs[2]
             # Inverse of the interpolation in okhsl_to_srgb:
-            mid = 0.8
-            midInv = 1.25
             if c < cMid:
-                k1 = mid * c0
+                k1 = MID * c0
                 k2 = 1 - k1 / cMid
                 t = c / (k1 + k2 * c)
-                s = t * mid
+                s = t * MID
             else:
-                k1 = (1 - mid) * cMid * cMid * midInv * midInv / c0
+                k1 = MID_K1 * cMid * cMid / c0
                 k2 = 1 - k1 / (cMax - cMid)
-                t = (c - cMid) / (k1 + k2 * (c - cMid))
-                s = mid + (1 - mid) * t
-        # gamut intersection jumps for parts of blue
-        h = ch[1] if not 264.052 < ch[1] < 264.06 else 264.06
+                dC = c - cMid
+                t = dC / (k1 + k2 * dC)
+                s = MID + (1 - MID) * t
         l = Convert.toe(l)
         return (round(h, 2), round(s * 100, 2), round(l * 100, 2))
 
@@ -955,11 +1009,13 @@ class Convert:
         l /= 100
         if l == 0 or l == 1:
             return (l, l, l)
-        ab = Convert.polarToCartesian(1, h)
+        hRad = radians(h)
+        a_ = cos(hRad)
+        b_ = sin(hRad)
         l = Convert.toeInv(l)
         c = 0
         if s:
-            cs = Convert.getCs(l, *ab)
+            cs = Convert.getCs(l, a_, b_)
             c0 = cs[0]
             cMid = cs[1]
             cMax = cs[2]
@@ -967,22 +1023,28 @@ class Convert:
             # At s=0: dC/ds = C_0, C=0
             # At s=0.8: C=C_mid
             # At s=1.0: C=C_max
-            mid = 0.8
-            midInv = 1.25
-            if s < mid:
-                t = midInv * s
-                k1 = mid * c0
+            if s < MID:
+                t = MID_INV * s
+                k1 = MID * c0
                 k2 = 1 - k1 / cMid
                 c = t * k1 / (1 - k2 * t)
             else:
-                t = (s - mid) / (1 - mid)
-                k1 = (1 - mid) * cMid * cMid * midInv * midInv / c0
+                t = (s - MID) / (1 - MID)
+                k1 = MID_K1 * cMid * cMid / c0
                 k2 = 1 - k1 / (cMax - cMid)
                 c = cMid + t * k1 / (1 - k2 * t)
-        rgb = Convert.oklabToLinear(l, ab[0] * c, ab[1] * c)
+        r, g, b = Convert.oklabToLinear(l, a_ * c, b_ * c)
         # perform transfer functions for components if output to sRGB
-        r = Convert.componentToSRGB(rgb[0]) if trc == "sRGB" else rgb[0]
-        g = Convert.componentToSRGB(rgb[1]) if trc == "sRGB" else rgb[1]
-        b = Convert.componentToSRGB(rgb[2]) if trc == "sRGB" else rgb[2]
+        if trc == "sRGB":
+            r = Convert.componentToSRGB(r)
+            g = Convert.componentToSRGB(g)
+            b = Convert.componentToSRGB(b)
         return (Convert.clampF(r), Convert.clampF(g), Convert.clampF(b))
-    
+
+
+# linear value of every 8 bit sRGB component, exact for hex notations
+SRGB8_TO_LINEAR = tuple(Convert.componentToLinear(i / 255.0) for i in range(256))
+# sRGB value halfway between each pair of neighbouring 8 bit sRGB components
+SRGB8_HALFWAYS = tuple((i + 0.5) / 255.0 for i in range(255))
+# linear values of those halfway points, to round linear components without encoding them
+SRGB8_THRESHOLDS = tuple(Convert.componentToLinear(c) for c in SRGB8_HALFWAYS)
@@ -35,6 +35,9 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+from enum import IntEnum
+
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QSize
 from PyQt5.QtGui import QPainter, QBrush, QColor, QLinearGradient, QPixmap, QIcon
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QDoubleSpinBox, QLabel, QLineEdit,
@@ -48,10 +51,13 @@ DOCKER_NAME = 'HCL Sliders'
 # adjust plugin sizes and update timing here
 TIME = 100 # ms time for plugin to update color from krita, faster updates may make krita slower
 DELAY = 300 # ms delay updating color history to prevent flooding when using the color picker
+THROTTLE = 8 # ms between channel updates while dragging a slider, longer intervals skip more positions
+REDRAW = 16 # ms between gradient updates while dragging a slider, about once per frame at 60hz
 DISPLAY_HEIGHT = 25 # px for color display panel at the top
 CHANNEL_HEIGHT = 19 # px for channels, also influences hex/ok syntax box and buttons
 MODEL_SPACING = 6 # px for spacing between color models
 HISTORY_HEIGHT = 16 # px for color history and area of each color box
+HISTORY_CACHE = 32 # recently clicked history colors kept as managed colors
 VALUES_WIDTH = 63 # px for spinboxes containing channel values
 LABEL_WIDTH = 11 # px for spacing of channel indicator/letter
 # adjust various sizes of config menu
@@ -65,9 +71,65 @@ SRGB = ('sRGB-elle-V2-srgbtrc.icc', 'sRGB built-in',
         'Gray-D50-elle-V2-srgbtrc.icc', 'Gray-D50-elle-V4-srgbtrc.icc')
 LINEAR = ('sRGB-elle-V2-g10.icc', 'krita-2.5, lcms sRGB built-in with linear gamma TRC', 
           'Gray-D50-elle-V2-g10.icc', 'Gray-D50-elle-V4-g10.icc')
+# transfer curve of each compatible profile
+PROFILE_TRC = {**dict.fromkeys(SRGB, "sRGB"), **dict.fromkeys(LINEAR, "linear")}
 NOTATION = ('HEX', 'OKLAB', 'OKLCH')
 
 
+class Family(IntEnum):
+    HSV = 0
+    HSL = 1
+    HCY = 2
+    # oklab based families come last
+    OKHCL = 3
+    OKHSV = 4
+    OKHSL = 5
+
+
+class Param(IntEnum):
+    HUE = 0
+    SATURATION = 1
+    VALUE = 2
+    LIGHTNESS = 3
+    CHROMA = 4
+    LUMA = 5
+
+
+# conversion of each channel's gradient and the position of the channel in its arguments
+GRADIENTS = {
+    (Family.HSV, Param.HUE): (Convert.hsvToRgbF, 0),
+    (Family.HSV, Param.SATURATION): (Convert.hsvToRgbF, 1),
+    (Family.HSV, Param.VALUE): (Convert.hsvToRgbF, 2),
+    (Family.HSL, Param.HUE): (Convert.hslToRgbF, 0),
+    (Family.HSL, Param.SATURATION): (Convert.hslToRgbF, 1),
+    (Family.HSL, Param.LIGHTNESS): (Convert.hslToRgbF, 2),
+    (Family.HCY, Param.HUE): (Convert.hcyToRgbF, 0),
+    (Family.HCY, Param.CHROMA): (Convert.hcyToRgbF, 1),
+    (Family.HCY, Param.LUMA): (Convert.hcyToRgbF, 2),
+    (Family.OKHCL, Param.HUE): (Convert.okhclToRgbF, 0),
+    (Family.OKHCL, Param.CHROMA): (Convert.okhclToRgbF, 1),
+    (Family.OKHCL, Param.LIGHTNESS): (Convert.okhclToRgbF, 2),
+    (Family.OKHSV, Param.HUE): (Convert.okhsvToRgbF, 0),
+    (Family.OKHSV, Param.SATURATION): (Convert.okhsvToRgbF, 1),
+    (Family.OKHSV, Param.VALUE): (Convert.okhsvToRgbF, 2),
+    (Family.OKHSL, Param.HUE): (Convert.okhslToRgbF, 0),
+    (Family.OKHSL, Param.SATURATION): (Convert.okhslToRgbF, 1),
+    (Family.OKHSL, Param.LIGHTNESS): (Convert.okhslToRgbF, 2),
+}
+# conversions to and from the css syntax of each notation
+SYNTAX_FORMAT = {
+    NOTATION[0]: Convert.rgbFToHexS,
+    NOTATION[1]: Convert.rgbFToOklabS,
+    NOTATION[2]: Convert.rgbFToOklchS,
+}
+# keyed by how the syntax starts, hex with its sign and oklab/oklch with their names
+SYNTAX_PARSE = {
+    "#": (NOTATION[0], Convert.hexSToRgbF),
+    "OKLAB": (NOTATION[1], Convert.oklabSToRgbF),
+    "OKLCH": (NOTATION[2], Convert.oklchSToRgbF),
+}
+
+
 class ColorDisplay(QWidget):
     
     def __init__(self, parent):
@@ -80,6 +142,8 @@ class ColorDisplay(QWidget):
         self.background = None
         self.temp = None
         self.bgMode = False
+        # pairs of held colors and their components, model, depth and profile
+        self.keys = []
         self.switchToolTip()
 
     def setCurrentColor(self, color=None):
@@ -104,43 +168,39 @@ class ColorDisplay(QWidget):
         self.foreground = None
         self.background = None
         self.temp = None
+        self.keys = []
         self.update()
 
+    def colorKey(self, color):
+        # read each color from krita once, it is kept for as long as the color is held
+        for cached, key in self.keys:
+            if cached is color:
+                return key
+        key = (tuple(color.components()), color.colorModel(), color.colorDepth(), color.colorProfile())
+        held = (self.current, self.recent, self.foreground, self.background)
+        self.keys = [pair for pair in self.keys if any(pair[0] is other for other in held)]
+        self.keys.append((color, key))
+        return key
+
+    def isSameColor(self, color, other):
+        if other is None:
+            return False
+        return color is other or self.colorKey(color) == self.colorKey(other)
+
     def isChanged(self):
         if self.current is None:
             return True
-        if self.bgMode:
-            if self.current.components() != self.background.components():
-                return True
-            if self.current.colorModel() != self.background.colorModel():
-                return True
-            if self.current.colorDepth() != self.background.colorDepth():
-                return True
-            if self.current.colorProfile() != self.background.colorProfile():
-                return True
-        else:
-            if self.current.components() != self.foreground.components():
-                return True
-            if self.current.colorModel() != self.foreground.colorModel():
-                return True
-            if self.current.colorDepth() != self.foreground.colorDepth():
-                return True
-            if self.current.colorProfile() != self.foreground.colorProfile():
-                return True
-        return False
+        other = self.background if self.bgMode else self.foreground
+        if self.current is other:
+            return False
+        return self.colorKey(self.current) != self.colorKey(other)
     
     def isChanging(self):
         if self.recent is None:
             return False
-        if self.recent.components() != self.current.components():
-            return True
-        if self.recent.colorModel() != self.current.colorModel():
-            return True
-        if self.recent.colorDepth() != self.current.colorDepth():
-            return True
-        if self.recent.colorProfile() != self.current.colorProfile():
-            return True
-        return False
+        if self.recent is self.current:
+            return False
+        return self.colorKey(self.recent) != self.colorKey(self.current)
     
     def switchToolTip(self):
         if self.bgMode:
@@ -197,6 +257,7 @@ class ColorHistory(QListWidget):
         self.modifier = None
         self.start = 0
         self.position = 0
+        self.colors = {}
         self.setFlow(QListWidget.Flow.LeftToRight)
         self.setFixedHeight(HISTORY_HEIGHT)
         self.setViewportMargins(-2, 0, 0, 0)
@@ -216,15 +277,34 @@ class ColorHistory(QListWidget):
         # disable keyboard interactions
         pass
 
+    def swatchIndex(self, event):
+        # swatches sit on a fixed grid so the row follows from the scrolled position
+        x = self.horizontalScrollBar().value() + event.x()
+        if event.x() < 0 or event.x() >= self.viewport().width() or not 0 <= event.y() < HISTORY_HEIGHT:
+            return -1
+        index = x // (HISTORY_HEIGHT + 2)
+        return index if index < len(self.hcl.pastColors) else -1
+
+    def managedColor(self, index: int):
+        # keyed by value so history edits need no invalidation
+        key = (self.hcl.pastColors[index], self.hcl.document.colorDepth())
+        color = self.colors.pop(key, None)
+        if not color:
+            color = self.hcl.makeManagedColor(*key[0])
+            if len(self.colors) >= HISTORY_CACHE:
+                del self.colors[next(iter(self.colors))]
+        # reinsert as most recently used
+        self.colors[key] = color
+        return color
+
     def mousePressEvent(self, event):
         self.hcl.setPressed(True)
-        item = self.itemAt(event.pos())
-        index = self.row(item)
+        index = self.swatchIndex(event)
 
         if index != -1:
             if (event.buttons() == Qt.MouseButton.LeftButton and 
                 event.modifiers() == Qt.KeyboardModifier.NoModifier):
-                color = self.hcl.makeManagedColor(*self.hcl.pastColors[index])
+                color = self.managedColor(index)
                 if color:
                     if self.hcl.color.bgMode:
                         self.hcl.color.setTempColor(color)
@@ -234,7 +314,7 @@ class ColorHistory(QListWidget):
                 self.modifier = Qt.KeyboardModifier.NoModifier
             elif (event.buttons() == Qt.MouseButton.LeftButton and 
                 event.modifiers() == Qt.KeyboardModifier.ControlModifier):
-                color = self.hcl.makeManagedColor(*self.hcl.pastColors[index])
+                color = self.managedColor(index)
                 if color:
                     if self.hcl.color.bgMode:
                         self.hcl.color.setCurrentColor(color)
@@ -264,8 +344,7 @@ class ColorHistory(QListWidget):
             self.startScrollShift(event)
 
     def mouseReleaseEvent(self, event):
-        item = self.itemAt(event.pos())
-        index = self.row(item)
+        index = self.swatchIndex(event)
 
         if index == self.index and index != -1:
             if (event.modifiers() == Qt.KeyboardModifier.NoModifier and 
@@ -283,9 +362,9 @@ class ColorHistory(QListWidget):
                 if self.index > index:
                     start = self.index
                     stop = index
-                for i in range(start, stop - 1, -1):
-                    self.takeItem(i)
-                    self.hcl.pastColors.pop(i)
+                # remove the whole range at once instead of relaying out for each item
+                self.model().removeRows(stop, start - stop + 1)
+                del self.hcl.pastColors[stop:start + 1]
 
         if self.modifier == Qt.KeyboardModifier.NoModifier and self.index != -1:
             if self.hcl.color.bgMode:
@@ -320,18 +399,40 @@ class ChannelSlider(QWidget):
         self.start = 0.0
         self.position = 0
         self.shift = 0.1
-        self.colors = []
+        self.stops = []
+        self.rgbs = ()
+        self.gradient = None
+        self.updateGradient()
+        # mouse moves can arrive faster than all channels can be updated
+        self.pending = False
+        self.throttle = QTimer(self)
+        self.throttle.setSingleShot(True)
+        self.throttle.setInterval(THROTTLE)
+        self.throttle.timeout.connect(self.emitPending)
 
     def setGradientColors(self, colors: list):
-        if self.colors:
-            self.colors = []
-        for rgb in colors:
-            # using rgbF as is may result in black as colors are out of gamut
-            color = QColor(*rgb)
-            self.colors.append(color)
+        # other channels moving often leave this strip as it is
+        if colors == self.rgbs:
+            return
+        self.rgbs = colors
+        # stops are positioned once here so resizing only has to rebuild the brush
+        last = max(len(colors) - 1, 1)
+        # using rgbF as is may result in black as colors are out of gamut
+        self.stops = [(index / last, QColor(*rgb)) for index, rgb in enumerate(colors)]
+        self.updateGradient()
         self.update()
 
+    def updateGradient(self):
+        # brush is kept between repaints as most of them only move the cursor
+        gradient = QLinearGradient(0, 0, self.width(), 0)
+        if self.stops:
+            gradient.setStops(self.stops)
+        self.gradient = QBrush(gradient)
+
     def setValue(self, value: float):
+        # other families often get their current values back, e.g. hue while adjusting saturation
+        if value == self.value:
+            return
         self.value = value
         self.update()
 
@@ -355,6 +456,20 @@ class ChannelSlider(QWidget):
             displacement = limit
         self.displacement = displacement
 
+    def emitValue(self):
+        # hold back values until the interval passes, only the latest one is emitted
+        if self.throttle.isActive():
+            self.pending = True
+            return
+        self.valueChanged.emit(self.value)
+        self.throttle.start()
+
+    def emitPending(self):
+        if self.pending:
+            self.pending = False
+            self.valueChanged.emit(self.value)
+            self.throttle.start()
+
     def emitValueChanged(self, event):
         position = event.x()
         width = self.width()
@@ -363,7 +478,7 @@ class ChannelSlider(QWidget):
         elif position < 0:
             position = 0.0
         self.value = round((position / width) * self.limit, 3)
-        self.valueChanged.emit(self.value)
+        self.emitValue()
         self.mousePressed.emit(True)
 
     def emitValueSnapped(self, event):
@@ -390,7 +505,7 @@ class ChannelSlider(QWidget):
                 value = 0.0
         
         self.value = value
-        self.valueChanged.emit(self.value)
+        self.emitValue()
         self.mousePressed.emit(True)
     
     def startValueShift(self, event):
@@ -414,7 +529,7 @@ class ChannelSlider(QWidget):
                 value = self.limit
           
         self.value = value
-        self.valueChanged.emit(self.value)
+        self.emitValue()
         self.mousePressed.emit(True)
 
     def mousePressEvent(self, event):
@@ -447,8 +562,15 @@ class ChannelSlider(QWidget):
         self.update()
 
     def mouseReleaseEvent(self, event):
+        # final value must not be held back after releasing
+        self.throttle.stop()
+        self.emitPending()
         self.mousePressed.emit(False)
 
+    def resizeEvent(self, event):
+        # gradient spans the width of the slider
+        self.updateGradient()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         width = self.width()
@@ -458,11 +580,7 @@ class ChannelSlider(QWidget):
         painter.setBrush( QBrush(QColor(0, 0, 0, 50)))
         painter.drawRect(0, 1, width, height - 2)
         # gradient
-        gradient = QLinearGradient(0, 0, width, 0)
-        if self.colors:
-            for index, color in enumerate(self.colors):
-                gradient.setColorAt(index / (len(self.colors) - 1), color)
-        painter.setBrush(QBrush(gradient))
+        painter.setBrush(self.gradient)
         painter.drawRect(1, 2, width - 2, height - 4)
         # cursor
         if self.limit:
@@ -476,9 +594,19 @@ class ChannelSlider(QWidget):
 class ColorChannel:
 
     channelList = None
+    # fixed attributes, channels are plain holders of their widgets and modes
+    __slots__ = ("name", "family", "param", "update", "refresh", "scale", "clip", "colorful", 
+                 "luma", "limit", "layout", "label", "slider", "spinBox")
 
     def __init__(self, name: str, parent):
         self.name = name
+        # parse the name once so redrawing compares enums instead of slicing strings
+        if self.name[:2] == "ok":
+            self.family = Family[self.name[:5].upper()]
+            self.param = Param[self.name[5:].upper()]
+        else:
+            self.family = Family[self.name[:3].upper()]
+            self.param = Param[self.name[3:].upper()]
         self.update = parent.updateChannels
         self.refresh = parent.updateChannelGradients
         wrap = False
@@ -489,14 +617,14 @@ class ColorChannel:
         self.colorful = False
         self.luma = False
         self.limit = 100.0
-        if self.name[-3:] == "Hue":
+        if self.param is Param.HUE:
             wrap = True
             interval = 30.0
-            if self.name[:2] == "ok":
+            if self.family >= Family.OKHCL:
                 interval = 40.0
                 displacement = 25.0
             self.limit = 360.0
-        elif self.name[-6:] == "Chroma":
+        elif self.param is Param.CHROMA:
             self.limit = 0.0
         self.layout = QHBoxLayout()
         self.layout.setSpacing(2)
@@ -524,7 +652,7 @@ class ColorChannel:
         self.slider.mousePressed.connect(parent.setPressed)
 
         self.spinBox = QDoubleSpinBox()
-        if self.name[-6:] == "Chroma":
+        if self.param is Param.CHROMA:
             self.spinBox.setDecimals(3)
         self.spinBox.setMaximum(self.limit)
         self.spinBox.setWrapping(wrap)
@@ -540,7 +668,7 @@ class ColorChannel:
         return self.spinBox.value()
     
     def setValue(self, value: float):
-        if self.name[-6:] == "Chroma" and self.limit >= 10:
+        if self.param is Param.CHROMA and self.limit >= 10:
             value = round(value, 2)
         self.slider.setValue(value)
         self.spinBox.setValue(value)
@@ -569,143 +697,94 @@ class ColorChannel:
         self.update(value, self.name, "spinBox")
     
     def updateGradientColors(self, firstConst: float, lastConst: float, trc: str, ChromaLimit: float=-1):
-        colors = []
-        if self.name[-3:] == "Hue":
-            if self.name[:2] == "ok":
-                # oklab hue needs more points for qcolor to blend more accurately
-                # range of 0 to 25 - 345 in 15deg increments to 360
-                points = 26
-                increment = self.limit / (points - 2)
-                displacement = increment - 25
-
-                if self.colorful:
-                    for number in range(points):
-                        hue = (number - 1) * increment - displacement
-                        if hue < 0:
-                            hue = 0
-                        elif hue > self.limit:
-                            hue = self.limit
-                        rgb = Convert.okhsvToRgbF(hue, 100.0, 100.0, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:5] == "okhcl":
-                    for number in range(points):
-                        hue = (number - 1) * increment - displacement
-                        if hue < 0:
-                            hue = 0
-                        elif hue > self.limit:
-                            hue = self.limit
-                        rgb = Convert.okhclToRgbF(hue, firstConst, lastConst, ChromaLimit, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:5] == "okhsv":
-                    for number in range(points):
-                        hue = (number - 1) * increment - displacement
-                        if hue < 0:
-                            hue = 0
-                        elif hue > self.limit:
-                            hue = self.limit
-                        rgb = Convert.okhsvToRgbF(hue, firstConst, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:5] == "okhsl":
-                    for number in range(points):
-                        hue = (number - 1) * increment - displacement
-                        if hue < 0:
-                            hue = 0
-                        elif hue > self.limit:
-                            hue = self.limit
-                        rgb = Convert.okhslToRgbF(hue, firstConst, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
+        if self.colorful and self.param is Param.HUE:
+            # colorful hues ignore other channels, so hue channels drawn the same way share them
+            if self.family >= Family.OKHCL:
+                colors = ColorChannel.gradientColors(Family.OKHSV, Param.HUE, 0.0, 0.0, trc, -1, 
+                                                     True, False, self.limit)
+            elif self.family is Family.HCY:
+                colors = ColorChannel.gradientColors(Family.HCY, Param.HUE, 0.0, 0.0, trc, -1, 
+                                                     True, self.luma, self.limit)
             else:
-                # range of 0 to 360deg incrementing by 30deg
-                points = 13
-                increment = self.limit / (points - 1)
-
-                if self.colorful:
-                    if self.name[:3] != "hcy":
-                        for number in range(points):
-                            rgb = Convert.hsvToRgbF(number * increment, 100.0, 100.0, trc)
-                            colors.append(Convert.rgbFToInt8(*rgb, trc))
-                    else:
-                        for number in range(points):
-                            rgb = Convert.hcyToRgbF(number * increment, 100.0, -1, -1, trc, self.luma)
-                            colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:3] == "hsv":
-                    for number in range(points):
-                        rgb = Convert.hsvToRgbF(number * increment, firstConst, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:3] == "hsl":
-                    for number in range(points):
-                        rgb = Convert.hslToRgbF(number * increment, firstConst, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[:3] == "hcy":
-                    for number in range(points):
-                        rgb = Convert.hcyToRgbF(number * increment, firstConst, lastConst, 
-                                                ChromaLimit, trc, self.luma)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
+                colors = ColorChannel.gradientColors(Family.HSV, Param.HUE, 0.0, 0.0, trc, -1, 
+                                                     True, False, self.limit)
+        else:
+            colors = ColorChannel.gradientColors(self.family, self.param, firstConst, lastConst, trc, 
+                                                 ChromaLimit, self.colorful, self.luma, self.limit)
+        self.slider.setGradientColors(colors)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    # cached as channels often redraw with the same constants, e.g. when only hue is adjusted
+    def gradientColors(family: Family, param: Param, firstConst: float, lastConst: float, trc: str, 
+                       ChromaLimit: float, colorful: bool, luma: bool, limit: float):
+        convert, axis = GRADIENTS[family, param]
+        # arguments of the conversion, where the value at axis is changed for each point
+        args = [firstConst, lastConst]
+        args.insert(axis, 0.0)
+        if family is Family.HCY:
+            args += [ChromaLimit, trc, luma]
+        elif family is Family.OKHCL:
+            args += [ChromaLimit, trc]
         else:
+            args.append(trc)
+
+        values = []
+        if axis:
             # range of 0 to 100% incrementing by 10%
             points = 11
-            increment = self.limit / (points - 1)
-
-            if self.name[:3] == "hsv":
-                if self.name[3:] == "Saturation":
-                    for number in range(points):
-                        rgb = Convert.hsvToRgbF(firstConst, number * increment, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[3:] == "Value":
-                    for number in range(points):
-                        rgb = Convert.hsvToRgbF(firstConst, lastConst, number * increment, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-            elif self.name[:3] == "hsl":
-                if self.name[3:] == "Saturation":
-                    for number in range(points):
-                        rgb = Convert.hslToRgbF(firstConst, number * increment, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[3:] == "Lightness":
-                    for number in range(points):
-                        rgb = Convert.hslToRgbF(firstConst, lastConst, number * increment, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-            elif self.name[:3] == "hcy":
-                if self.name[3:] == "Chroma":
-                    for number in range(points):
-                        rgb = Convert.hcyToRgbF(firstConst, number * increment, lastConst, 
-                                                ChromaLimit, trc, self.luma)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[3:] == "Luma":
-                    for number in range(points):
-                        rgb = Convert.hcyToRgbF(firstConst, lastConst, number * increment, 
-                                                ChromaLimit, trc, self.luma)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-            elif self.name[:5] == "okhcl":
-                if self.name[5:] == "Chroma":
-                    for number in range(points):
-                        rgb = Convert.okhclToRgbF(firstConst, number * increment, lastConst, 
-                                                  ChromaLimit, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[5:] == "Lightness":
-                    for number in range(points):
-                        rgb = Convert.okhclToRgbF(firstConst, lastConst, number * increment, 
-                                                  ChromaLimit, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-            elif self.name[:5] == "okhsv":
-                if self.name[5:] == "Saturation":
-                    for number in range(points):
-                        rgb = Convert.okhsvToRgbF(firstConst, number * increment, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[5:] == "Value":
-                    for number in range(points):
-                        rgb = Convert.okhsvToRgbF(firstConst, lastConst, number * increment, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-            elif self.name[:5] == "okhsl":
-                if self.name[5:] == "Saturation":
-                    for number in range(points):
-                        rgb = Convert.okhslToRgbF(firstConst, number * increment, lastConst, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
-                elif self.name[5:] == "Lightness":
-                    for number in range(points):
-                        rgb = Convert.okhslToRgbF(firstConst, lastConst, number * increment, trc)
-                        colors.append(Convert.rgbFToInt8(*rgb, trc))
+            increment = limit / (points - 1)
+            for number in range(points):
+                values.append(number * increment)
+        elif family >= Family.OKHCL:
+            # oklab hue needs more points for qcolor to blend more accurately
+            # range of 0 to 25 - 345 in 15deg increments to 360
+            points = 26
+            increment = limit / (points - 2)
+            displacement = increment - 25
+            for number in range(points):
+                hue = (number - 1) * increment - displacement
+                if hue < 0:
+                    hue = 0
+                elif hue > limit:
+                    hue = limit
+                values.append(hue)
+            if colorful:
+                convert = Convert.okhsvToRgbF
+                args = [0.0, 100.0, 100.0, trc]
+        else:
+            # range of 0 to 360deg incrementing by 30deg
+            points = 13
+            increment = limit / (points - 1)
+            for number in range(points):
+                values.append(number * increment)
+            if colorful and family is Family.HCY:
+                convert = Convert.hcyMaxChromaToRgbF
+                args = [0.0, trc, luma]
+            elif colorful:
+                convert = Convert.hsvToRgbF
+                args = [0.0, 100.0, 100.0, trc]
+
+        # hsv, hsl and hcy using luma are computed in sRGB, 
+        # so for linear documents skip converting them to linear and back for display
+        encode = True
+        if trc == "linear":
+            if convert is Convert.hsvToRgbF or convert is Convert.hslToRgbF:
+                args[-1] = "sRGB"
+                encode = False
+            elif luma and family is Family.HCY:
+                args[-2] = "sRGB"
+                encode = False
 
-        self.slider.setGradientColors(colors)
+        colors = []
+        for value in values:
+            args[axis] = value
+            r, g, b = convert(*args)
+            if encode:
+                colors.append(Convert.rgbFToInt8(r, g, b, trc))
+            else:
+                colors.append(Convert.srgbFToInt8(r, g, b))
+        return tuple(colors)
 
     def blockSignals(self, block: bool):
         self.slider.blockSignals(block)
@@ -731,6 +810,11 @@ class SliderConfig(QDialog):
         self.setWindowTitle("Configure HCL Sliders")
         self.setFixedSize(*CONFIG_SIZE)
         self.mainLayout = QHBoxLayout(self)
+        # moves and toggles can come in bursts, reorder once after they settle
+        self.reorder = QTimer(self)
+        self.reorder.setSingleShot(True)
+        self.reorder.setInterval(0)
+        self.reorder.timeout.connect(self.reorderSliders)
         self.loadPages()
 
     def loadPages(self):
@@ -756,6 +840,8 @@ class SliderConfig(QDialog):
                 self.models.setdefault(name[:5].upper(), []).append(name)
             else:
                 self.models.setdefault(name[:3].upper(), []).append(name)
+        # pages are added in the same order as models
+        self.modelIndex = {model: index for index, model in enumerate(self.models)}
         
         self.checkBoxes = {}
         for model, channels in self.models.items():
@@ -848,9 +934,9 @@ class SliderConfig(QDialog):
                 tabs.tabBar().setTabButton(tabs.tabBar().count() - 1, 
                                            tabs.tabBar().ButtonPosition.LeftSide, checkBox)
                 checkBox.toggled.connect(tab.setEnabled)
-                checkBox.stateChanged.connect(self.reorderSliders)
+                checkBox.stateChanged.connect(self.queueReorder)
 
-            tabs.tabBar().tabMoved.connect(self.reorderSliders)
+            tabs.tabBar().tabMoved.connect(self.queueReorder)
             self.pages.addWidget(tabs)
             self.pageList.addItem(model)
             item = self.pageList.item(self.pageList.count() - 1)
@@ -858,7 +944,7 @@ class SliderConfig(QDialog):
             item.setCheckState(Qt.CheckState.Checked) if model in visible else item.setCheckState(
                 Qt.CheckState.Unchecked)
             tabs.setEnabled(item.checkState() == Qt.CheckState.Checked)
-        self.pageList.model().rowsMoved.connect(self.reorderSliders)
+        self.pageList.model().rowsMoved.connect(self.queueReorder)
         self.pageList.itemPressed.connect(self.changePage)
         self.pageList.currentTextChanged.connect(self.changePage)
         self.pageList.itemChanged.connect(self.toggleModel)
@@ -917,7 +1003,7 @@ class SliderConfig(QDialog):
     def changePage(self, item: str|QListWidgetItem):
         if isinstance(item, QListWidgetItem):
             item = item.text()
-        self.pages.setCurrentIndex(list(self.models.keys()).index(item))
+        self.pages.setCurrentIndex(self.modelIndex[item])
         self.others.setChecked(False)
 
     def changeOthers(self):
@@ -932,9 +1018,15 @@ class SliderConfig(QDialog):
         else:
             state = state == Qt.CheckState.Checked
             self.hcl.syntax.setEnabled(state)
-        # Refresh hcl layout
+        # Refresh hcl layout, repainting once after all widgets are moved
+        self.hcl.widget().setUpdatesEnabled(False)
         self.hcl.clearOthers()
         self.hcl.displayOthers()
+        self.hcl.widget().setUpdatesEnabled(True)
+
+    def queueReorder(self):
+        # signal arguments are dropped so they are not taken as the timer interval
+        self.reorder.start()
 
     def reorderSliders(self):
         # Get new display order
@@ -943,24 +1035,29 @@ class SliderConfig(QDialog):
             item = self.pageList.item(row)
             if item.checkState() == Qt.CheckState.Checked:
                 model = item.text()
-                tabs = self.pages.widget(list(self.models.keys()).index(model))
+                tabs = self.pages.widget(self.modelIndex[model])
                 for index in range(tabs.count()):
                     # visible tabs have '&' in text used for shortcut
                     param = tabs.tabText(index).replace('&', '')
                     name = f"{model.lower()}{param}"
                     if self.checkBoxes[name].isChecked():
                         self.hcl.displayOrder.append(name)
-        # Refresh channel layout
+        # Refresh channel layout, repainting once after all widgets are moved
+        self.hcl.widget().setUpdatesEnabled(False)
         self.hcl.clearChannels()
         self.hcl.displayChannels()
+        self.hcl.widget().setUpdatesEnabled(True)
 
     def toggleModel(self, item: QListWidgetItem):
-        tabs = self.pages.widget(list(self.models.keys()).index(item.text()))
+        tabs = self.pages.widget(self.modelIndex[item.text()])
         tabs.setEnabled(item.checkState() == Qt.CheckState.Checked)
         
-        self.reorderSliders()
+        self.queueReorder()
 
     def closeEvent(self, event):
+        if self.reorder.isActive():
+            self.reorder.stop()
+            self.reorderSliders()
         self.hcl.writeSettings()
         event.accept()
 
@@ -984,6 +1081,23 @@ class HCLSliders(DockWidget):
         self.pressed = False
         self.editing = False
         self.pastColors = []
+        self.families = set()
+        self.adjusters = {
+            Family.HSV: self.adjustHsv,
+            Family.HSL: self.adjustHsl,
+            Family.HCY: self.adjustHcy,
+            Family.OKHCL: self.adjustOkhcl,
+            Family.OKHSV: self.adjustOkhsv,
+            Family.OKHSL: self.adjustOkhsl,
+        }
+        self.setters = {
+            "hsv": self.setHsvValues,
+            "hsl": self.setHslValues,
+            "hcy": self.setHcyValues,
+            "okhcl": self.setOkhclValues,
+            "okhsv": self.setOkhsvValues,
+            "okhsl": self.setOkhslValues,
+        }
         self.loadChannels()
         self.history = ColorHistory(self)
         self.loadSyntax()
@@ -1015,6 +1129,12 @@ class HCLSliders(DockWidget):
         self.singleShot = QTimer()
         self.singleShot.setSingleShot(True)
         self.singleShot.timeout.connect(self.setHistory)
+        # gradients only need to keep up with the screen while dragging
+        self.redrawPending = False
+        self.redraw = QTimer()
+        self.redraw.setSingleShot(True)
+        self.redraw.setInterval(REDRAW)
+        self.redraw.timeout.connect(self.redrawPendingGradients)
         return layout
     
     def loadChannels(self):
@@ -1051,6 +1171,8 @@ class HCLSliders(DockWidget):
         self.okhslHue = ColorChannel("okhslHue", self)
         self.okhslSaturation = ColorChannel("okhslSaturation", self)
         self.okhslLightness = ColorChannel("okhslLightness", self)
+        # every channel has its signals blocked together on each update
+        self.channels = tuple(getattr(self, name) for name in ColorChannel.getList())
         
         self.mainLayout.addLayout(self.channelLayout)
 
@@ -1090,16 +1212,16 @@ class HCLSliders(DockWidget):
                 except ValueError:
                     print(f"Invalid displacement amount for {name}")
 
-                if (name[:3] == "hcy" or name[:5] == "okhcl") and name[-6:] != "Chroma":
+                if channel.family in (Family.HCY, Family.OKHCL) and channel.param is not Param.CHROMA:
                     channel.scale = settings[2] == "True"
 
-                if name[-3:] == "Hue":
+                if channel.param is Param.HUE:
                     if len(settings) > 3:
                         channel.colorful = settings[3] == "True"
                     else:
                         channel.colorful = settings[2] == "True"
 
-                if name[:3] == "hcy":
+                if channel.family is Family.HCY:
                     channel.luma = settings[-1] == "True"
         
         self.displayOrder = []
@@ -1122,7 +1244,7 @@ class HCLSliders(DockWidget):
                 if 0 <= memory <= 999:
                     self.memory = memory
             except ValueError:
-                ("Invalid memory value")
+                print("Invalid memory value")
         
         syntax = Application.readSetting(DOCKER_NAME, "syntax", "").split(",")
         if len(syntax) == 2:
@@ -1140,11 +1262,11 @@ class HCLSliders(DockWidget):
             settings.append(str(channel.slider.interval))
             settings.append(str(channel.slider.displacement))
 
-            if (name[:3] == "hcy" or name[:5] == "okhcl") and name[-6:] != "Chroma":
+            if channel.family in (Family.HCY, Family.OKHCL) and channel.param is not Param.CHROMA:
                 settings.append(str(channel.scale))
-            if name[-3:] == "Hue":
+            if channel.param is Param.HUE:
                 settings.append(str(channel.colorful))
-            if name[:3] == "hcy":
+            if channel.family is Family.HCY:
                 settings.append(str(channel.luma))
             
             Application.writeSetting(DOCKER_NAME, name, ",".join(settings))
@@ -1157,17 +1279,35 @@ class HCLSliders(DockWidget):
 
     def displayChannels(self):
         prev = ""
+        families = set()
         for name in self.displayOrder:
+            model = name[:5] if name[:2] == "ok" else name[:3]
             if MODEL_SPACING:
-                model = name[:5] if name[:2] == "ok" else name[:3]
                 if prev and prev != model:
                     self.channelLayout.addSpacing(MODEL_SPACING)
                 prev = model
+            families.add(model)
             channel = getattr(self, name)
             channel.layout.addWidget(channel.label)
             channel.layout.addWidget(channel.slider)
             channel.layout.addWidget(channel.spinBox)
             self.channelLayout.addLayout(channel.layout)
+        # hidden families are not updated, so catch up on the ones shown again
+        shown = families - self.families
+        self.families = families
+        if shown and self.color.current:
+            self.timer.stop()
+            self.blockChannels(True)
+            rgb = self.colorRgb(self.color.current)
+            trc = self.profileTRC(self.color.current.colorProfile())
+            if trc != self.trc:
+                rgb = Convert.rgbToTRC(rgb, self.trc)
+            for model in shown:
+                self.setChannelValues(model, rgb)
+                self.updateChannelGradients(model)
+            self.blockChannels(False)
+            if TIME and self.isVisible():
+                self.timer.start(TIME)
 
     def clearChannels(self):
         # first 2 items in channelLayout is color display and spacing
@@ -1216,23 +1356,36 @@ class HCLSliders(DockWidget):
         self.config.show()
 
     def profileTRC(self, profile: str):
-        if profile in SRGB:
-            return "sRGB"
-        elif profile in LINEAR:
-            return "linear"
+        trc = PROFILE_TRC.get(profile)
+        if trc:
+            return trc
         print("Incompatible profile")
         return self.trc
     
+    def colorRgb(self, color):
+        # components are read once and indexed, gray colors only have one for all of rgb
+        components = color.componentsOrdered()
+        if color.colorModel() == "A" or color.colorModel() == "GRAYA":
+            return (components[0], components[0], components[0])
+        return (components[0], components[1], components[2])
+
     def setMemory(self, memory: int):
         self.memory = memory
 
     def setPressed(self, pressed: bool):
         self.pressed = pressed
+        if not pressed and self.redraw.isActive():
+            # draw the final gradients straight away on release
+            self.redraw.stop()
+            self.redrawPendingGradients()
 
     def finishEditing(self):
         self.editing = False
 
     def getKritaColors(self):
+        # nothing is shown while hidden, the poll started by showEvent catches up
+        if not self.isVisible():
+            return
         view = Application.activeWindow().activeView()
         if not view.visible():
             return
@@ -1242,24 +1395,24 @@ class HCLSliders(DockWidget):
             if self.color.isChanged() and self.color.current:
                 self.setHistory()
 
+            # keep the held colors if krita reports the same ones to skip repainting every poll
             foreground = view.foregroundColor()
-            self.color.setForeGroundColor(foreground)
+            if not self.color.isSameColor(foreground, self.color.foreground):
+                self.color.setForeGroundColor(foreground)
             background = view.backgroundColor()
-            self.color.setBackGroundColor(background)
+            if not self.color.isSameColor(background, self.color.background):
+                self.color.setBackGroundColor(background)
 
             if self.color.isChanged():
                 if self.color.bgMode:
-                    self.color.setCurrentColor(background)
+                    self.color.setCurrentColor(self.color.background)
                 else:
-                    self.color.setCurrentColor(foreground)
+                    self.color.setCurrentColor(self.color.foreground)
 
                 current = self.color.current
-                rgb = tuple(current.componentsOrdered()[:3])
-                if current.colorModel() != "RGBA":
-                    if current.colorModel() == "A" or current.colorModel() == "GRAYA":
-                        rgb = (rgb[0], rgb[0], rgb[0])
-                    else:
-                        return
+                if current.colorModel() not in ("RGBA", "A", "GRAYA"):
+                    return
+                rgb = self.colorRgb(current)
                 
                 trc = self.profileTRC(current.colorProfile())
                 self.updateSyntax(rgb, trc)          
@@ -1272,30 +1425,8 @@ class HCLSliders(DockWidget):
                     self.singleShot.start(DELAY)
 
     def blockChannels(self, block: bool):
-        # hsv
-        self.hsvHue.blockSignals(block)
-        self.hsvSaturation.blockSignals(block)
-        self.hsvValue.blockSignals(block)
-        # hsl
-        self.hslHue.blockSignals(block)
-        self.hslSaturation.blockSignals(block)
-        self.hslLightness.blockSignals(block)
-        # hcy
-        self.hcyHue.blockSignals(block)
-        self.hcyChroma.blockSignals(block)
-        self.hcyLuma.blockSignals(block)
-        # okhcl
-        self.okhclHue.blockSignals(block)
-        self.okhclChroma.blockSignals(block)
-        self.okhclLightness.blockSignals(block)
-        # okhsv
-        self.okhsvHue.blockSignals(block)
-        self.okhsvSaturation.blockSignals(block)
-        self.okhsvValue.blockSignals(block)
-        # okhsl
-        self.okhslHue.blockSignals(block)
-        self.okhslSaturation.blockSignals(block)
-        self.okhslLightness.blockSignals(block)
+        for channel in self.channels:
+            channel.blockSignals(block)
 
     def updateChannels(self, values: tuple|float, name: str=None, widget: str=None):
         self.timer.stop()
@@ -1317,239 +1448,267 @@ class HCLSliders(DockWidget):
             if widget == "slider":
                 # prevent getKritaColors when still editing spinBox
                 self.editing = True
-            # adjusting hsv sliders
-            if name[:3] == "hsv":
-                hue = self.hsvHue.value()
-                rgb = Convert.hsvToRgbF(hue, self.hsvSaturation.value(), 
-                                        self.hsvValue.value(), self.trc)
-                self.setKritaColor(rgb)
-                self.setChannelValues("hsl", rgb, hue)
-                if self.hcyLuma.luma or self.trc == "sRGB":
-                    self.setChannelValues("hcy", rgb, hue)
-                else: 
-                    self.setChannelValues("hcy", rgb)
-                self.setChannelValues("okhcl", rgb)
-                self.setChannelValues("okhsv", rgb)
-                self.setChannelValues("okhsl", rgb)
-            # adjusting hsl sliders
-            elif name[:3] == "hsl":
-                hue = self.hslHue.value()
-                rgb = Convert.hslToRgbF(hue, self.hslSaturation.value(), 
-                                        self.hslLightness.value(), self.trc)
-                self.setKritaColor(rgb)
-                self.setChannelValues("hsv", rgb, hue)
-                if self.hcyLuma.luma or self.trc == "sRGB":
-                    self.setChannelValues("hcy", rgb, hue)
-                else:
-                    self.setChannelValues("hcy", rgb)
-                self.setChannelValues("okhcl", rgb)
-                self.setChannelValues("okhsv", rgb)
-                self.setChannelValues("okhsl", rgb)
-            # adjusting hcy sliders
-            elif name[:3] == "hcy":
-                hue = self.hcyHue.value()
-                chroma = self.hcyChroma.value()
-                limit = -1
-                if channel.scale:
-                    if self.hcyChroma.limit > 0:
-                        self.hcyChroma.clip = chroma
-                    limit = self.hcyChroma.limit
-                else:
-                    if self.hcyChroma.clip == 0:
-                        self.hcyChroma.clip = chroma
-                    else:
-                        chroma = self.hcyChroma.clip
-                rgb = Convert.hcyToRgbF(hue, chroma, self.hcyLuma.value(), 
-                                        limit, self.trc, channel.luma)
-                self.setKritaColor(rgb)
-                if name[-6:] != "Chroma":
-                    hcy = Convert.rgbFToHcy(*rgb, hue, self.trc, channel.luma)
-                    self.hcyChroma.setLimit(hcy[3])
-                    self.hcyChroma.setValue(hcy[1])
-                # relative luminance doesnt match luma in hue
-                if channel.luma or self.trc == "sRGB":
-                    self.setChannelValues("hsv", rgb, hue)
-                    self.setChannelValues("hsl", rgb, hue)
-                else:
-                    self.setChannelValues("hsv", rgb)
-                    self.setChannelValues("hsl", rgb)
-                self.setChannelValues("okhcl", rgb)
-                self.setChannelValues("okhsv", rgb)
-                self.setChannelValues("okhsl", rgb)
-            # adjusting okhcl sliders
-            elif name[:5] == "okhcl":
-                hue = self.okhclHue.value()
-                chroma = self.okhclChroma.value()
-                limit = -1
-                if channel.scale:
-                    if self.okhclChroma.limit > 0:
-                        self.okhclChroma.clip = chroma
-                    limit = self.okhclChroma.limit
-                else:
-                    if self.okhclChroma.clip == 0:
-                        self.okhclChroma.clip = chroma
-                    else:
-                        chroma = self.okhclChroma.clip
-                rgb = Convert.okhclToRgbF(hue, chroma, self.okhclLightness.value(), limit, self.trc)
-                self.setKritaColor(rgb)
-                if name[-6:] != "Chroma":
-                    okhcl = Convert.rgbFToOkhcl(*rgb, hue, self.trc)
-                    self.okhclChroma.setLimit(okhcl[3])
-                    self.okhclChroma.setValue(okhcl[1])
-                self.setChannelValues("hsv", rgb)
-                self.setChannelValues("hsl", rgb)
-                self.setChannelValues("hcy", rgb)
-                self.setChannelValues("okhsv", rgb, hue)
-                self.setChannelValues("okhsl", rgb, hue)
-            # adjusting okhsv sliders
-            elif name[:5] == "okhsv":
-                hue = self.okhsvHue.value()
-                rgb = Convert.okhsvToRgbF(hue, self.okhsvSaturation.value(), 
-                                          self.okhsvValue.value(), self.trc)
-                self.setKritaColor(rgb)
-                self.setChannelValues("hsv", rgb)
-                self.setChannelValues("hsl", rgb)
-                self.setChannelValues("hcy", rgb)
-                self.setChannelValues("okhcl", rgb, hue)
-                self.setChannelValues("okhsl", rgb, hue)
-            # adjusting okhsl sliders
-            elif name[:5] == "okhsl":
-                hue = self.okhslHue.value()
-                rgb = Convert.okhslToRgbF(hue, self.okhslSaturation.value(), 
-                                          self.okhslLightness.value(), self.trc)
-                self.setKritaColor(rgb)
-                self.setChannelValues("hsv", rgb)
-                self.setChannelValues("hsl", rgb)
-                self.setChannelValues("hcy", rgb)
-                self.setChannelValues("okhcl", rgb, hue)
-                self.setChannelValues("okhsv", rgb, hue)
+            # adjusting a slider sets the color and the other families follow
+            self.adjusters[channel.family](channel)
         
-        self.updateChannelGradients()
+        self.redrawGradients()
         self.blockChannels(False)
-        if TIME:
+        if TIME and self.isVisible():
             self.timer.start(TIME)
 
+    def adjustHsv(self, channel: ColorChannel):
+        hue = self.hsvHue.value()
+        rgb = Convert.hsvToRgbF(hue, self.hsvSaturation.value(),
+                                self.hsvValue.value(), self.trc)
+        self.setKritaColor(rgb)
+        self.setChannelValues("hsl", rgb, hue)
+        if self.hcyLuma.luma or self.trc == "sRGB":
+            self.setChannelValues("hcy", rgb, hue)
+        else: 
+            self.setChannelValues("hcy", rgb)
+        self.setChannelValues("okhcl", rgb)
+        self.setChannelValues("okhsv", rgb)
+        self.setChannelValues("okhsl", rgb)
+
+    def adjustHsl(self, channel: ColorChannel):
+        hue = self.hslHue.value()
+        rgb = Convert.hslToRgbF(hue, self.hslSaturation.value(),
+                                self.hslLightness.value(), self.trc)
+        self.setKritaColor(rgb)
+        self.setChannelValues("hsv", rgb, hue)
+        if self.hcyLuma.luma or self.trc == "sRGB":
+            self.setChannelValues("hcy", rgb, hue)
+        else:
+            self.setChannelValues("hcy", rgb)
+        self.setChannelValues("okhcl", rgb)
+        self.setChannelValues("okhsv", rgb)
+        self.setChannelValues("okhsl", rgb)
+
+    def adjustHcy(self, channel: ColorChannel):
+        hue = self.hcyHue.value()
+        chroma = self.hcyChroma.value()
+        limit = -1
+        if channel.scale:
+            if self.hcyChroma.limit > 0:
+                self.hcyChroma.clip = chroma
+            limit = self.hcyChroma.limit
+        else:
+            if self.hcyChroma.clip == 0:
+                self.hcyChroma.clip = chroma
+            else:
+                chroma = self.hcyChroma.clip
+        rgb = Convert.hcyToRgbF(hue, chroma, self.hcyLuma.value(),
+                                limit, self.trc, channel.luma)
+        self.setKritaColor(rgb)
+        if channel.param is not Param.CHROMA:
+            hcy = Convert.rgbFToHcy(*rgb, hue, self.trc, channel.luma)
+            self.hcyChroma.setLimit(hcy[3])
+            self.hcyChroma.setValue(hcy[1])
+        # relative luminance doesnt match luma in hue
+        if channel.luma or self.trc == "sRGB":
+            self.setChannelValues("hsv", rgb, hue)
+            self.setChannelValues("hsl", rgb, hue)
+        else:
+            self.setChannelValues("hsv", rgb)
+            self.setChannelValues("hsl", rgb)
+        self.setChannelValues("okhcl", rgb)
+        self.setChannelValues("okhsv", rgb)
+        self.setChannelValues("okhsl", rgb)
+
+    def adjustOkhcl(self, channel: ColorChannel):
+        hue = self.okhclHue.value()
+        chroma = self.okhclChroma.value()
+        limit = -1
+        if channel.scale:
+            if self.okhclChroma.limit > 0:
+                self.okhclChroma.clip = chroma
+            limit = self.okhclChroma.limit
+        else:
+            if self.okhclChroma.clip == 0:
+                self.okhclChroma.clip = chroma
+            else:
+                chroma = self.okhclChroma.clip
+        rgb = Convert.okhclToRgbF(hue, chroma, self.okhclLightness.value(), limit, self.trc)
+        self.setKritaColor(rgb)
+        if channel.param is not Param.CHROMA:
+            okhcl = Convert.rgbFToOkhcl(*rgb, hue, self.trc)
+            self.okhclChroma.setLimit(okhcl[3])
+            self.okhclChroma.setValue(okhcl[1])
+        self.setChannelValues("hsv", rgb)
+        self.setChannelValues("hsl", rgb)
+        self.setChannelValues("hcy", rgb)
+        self.setChannelValues("okhsv", rgb, hue)
+        self.setChannelValues("okhsl", rgb, hue)
+
+    def adjustOkhsv(self, channel: ColorChannel):
+        hue = self.okhsvHue.value()
+        rgb = Convert.okhsvToRgbF(hue, self.okhsvSaturation.value(),
+                                  self.okhsvValue.value(), self.trc)
+        self.setKritaColor(rgb)
+        self.setChannelValues("hsv", rgb)
+        self.setChannelValues("hsl", rgb)
+        self.setChannelValues("hcy", rgb)
+        self.setChannelValues("okhcl", rgb, hue)
+        self.setChannelValues("okhsl", rgb, hue)
+
+    def adjustOkhsl(self, channel: ColorChannel):
+        hue = self.okhslHue.value()
+        rgb = Convert.okhslToRgbF(hue, self.okhslSaturation.value(),
+                                  self.okhslLightness.value(), self.trc)
+        self.setKritaColor(rgb)
+        self.setChannelValues("hsv", rgb)
+        self.setChannelValues("hsl", rgb)
+        self.setChannelValues("hcy", rgb)
+        self.setChannelValues("okhcl", rgb, hue)
+        self.setChannelValues("okhsv", rgb, hue)
+
+    def redrawGradients(self):
+        # hold back redraws until the interval passes while pressed, only the latest is drawn
+        if self.redraw.isActive():
+            self.redrawPending = True
+            return
+        self.updateChannelGradients()
+        if self.pressed:
+            self.redraw.start()
+
+    def redrawPendingGradients(self):
+        if self.redrawPending:
+            self.redrawPending = False
+            self.updateChannelGradients()
+            if self.pressed:
+                self.redraw.start()
+
     def updateChannelGradients(self, channels: str=None):
-        if not channels or channels == "hsv":
-            self.hsvHue.updateGradientColors(self.hsvSaturation.value(), self.hsvValue.value(), 
+        if (not channels or channels == "hsv") and "hsv" in self.families:
+            self.hsvHue.updateGradientColors(self.hsvSaturation.value(), self.hsvValue.value(),
                                              self.trc)
-            self.hsvSaturation.updateGradientColors(self.hsvHue.value(), self.hsvValue.value(), 
+            self.hsvSaturation.updateGradientColors(self.hsvHue.value(), self.hsvValue.value(),
                                                     self.trc)
-            self.hsvValue.updateGradientColors(self.hsvHue.value(), self.hsvSaturation.value(), 
+            self.hsvValue.updateGradientColors(self.hsvHue.value(), self.hsvSaturation.value(),
                                                self.trc)
-        if not channels or channels == "hsl":
-            self.hslHue.updateGradientColors(self.hslSaturation.value(), self.hslLightness.value(), 
+        if (not channels or channels == "hsl") and "hsl" in self.families:
+            self.hslHue.updateGradientColors(self.hslSaturation.value(), self.hslLightness.value(),
                                              self.trc)
-            self.hslSaturation.updateGradientColors(self.hslHue.value(), self.hslLightness.value(), 
+            self.hslSaturation.updateGradientColors(self.hslHue.value(), self.hslLightness.value(),
                                                     self.trc)
-            self.hslLightness.updateGradientColors(self.hslHue.value(), self.hslSaturation.value(), 
+            self.hslLightness.updateGradientColors(self.hslHue.value(), self.hslSaturation.value(),
                                                    self.trc)
-        if not channels or channels == "hcy":
+        if (not channels or channels == "hcy") and "hcy" in self.families:
             hcyClip = self.hcyChroma.value()
             if self.hcyChroma.clip > 0:
                 hcyClip = self.hcyChroma.clip
             if self.hcyHue.scale:
-                self.hcyHue.updateGradientColors(self.hcyChroma.value(), self.hcyLuma.value(), 
+                self.hcyHue.updateGradientColors(self.hcyChroma.value(), self.hcyLuma.value(),
                                                  self.trc, self.hcyChroma.limit)
             else:
                 self.hcyHue.updateGradientColors(hcyClip, self.hcyLuma.value(), self.trc)
-            self.hcyChroma.updateGradientColors(self.hcyHue.value(), self.hcyLuma.value(), 
+            self.hcyChroma.updateGradientColors(self.hcyHue.value(), self.hcyLuma.value(),
                                                 self.trc, self.hcyChroma.limit)
             if self.hcyLuma.scale:
-                self.hcyLuma.updateGradientColors(self.hcyHue.value(), self.hcyChroma.value(), 
+                self.hcyLuma.updateGradientColors(self.hcyHue.value(), self.hcyChroma.value(),
                                                   self.trc, self.hcyChroma.limit)
             else:
                 self.hcyLuma.updateGradientColors(self.hcyHue.value(), hcyClip, self.trc)
-        if not channels or channels == "okhcl":
+        if (not channels or channels == "okhcl") and "okhcl" in self.families:
             okhclClip = self.okhclChroma.value()
             if self.okhclChroma.clip > 0:
                 okhclClip = self.okhclChroma.clip
             if self.okhclHue.scale:
-                self.okhclHue.updateGradientColors(self.okhclChroma.value(), self.okhclLightness.value(), 
+                self.okhclHue.updateGradientColors(self.okhclChroma.value(), self.okhclLightness.value(),
                                                    self.trc, self.okhclChroma.limit)
             else:
                 self.okhclHue.updateGradientColors(okhclClip, self.okhclLightness.value(), self.trc)
-            self.okhclChroma.updateGradientColors(self.okhclHue.value(), self.okhclLightness.value(), 
+            self.okhclChroma.updateGradientColors(self.okhclHue.value(), self.okhclLightness.value(),
                                                   self.trc, self.okhclChroma.limit)
             if self.okhclLightness.scale:
-                self.okhclLightness.updateGradientColors(self.okhclHue.value(), self.okhclChroma.value(), 
+                self.okhclLightness.updateGradientColors(self.okhclHue.value(), self.okhclChroma.value(),
                                                          self.trc, self.okhclChroma.limit)
             else:
                 self.okhclLightness.updateGradientColors(self.okhclHue.value(), okhclClip, self.trc)
-        if not channels or channels == "okhsv":
-            self.okhsvHue.updateGradientColors(self.okhsvSaturation.value(), 
+        if (not channels or channels == "okhsv") and "okhsv" in self.families:
+            self.okhsvHue.updateGradientColors(self.okhsvSaturation.value(),
                                                self.okhsvValue.value(), self.trc)
-            self.okhsvSaturation.updateGradientColors(self.okhsvHue.value(), 
+            self.okhsvSaturation.updateGradientColors(self.okhsvHue.value(),
                                                       self.okhsvValue.value(), self.trc)
-            self.okhsvValue.updateGradientColors(self.okhsvHue.value(), 
+            self.okhsvValue.updateGradientColors(self.okhsvHue.value(),
                                                  self.okhsvSaturation.value(), self.trc)
-        if not channels or channels == "okhsl":
-            self.okhslHue.updateGradientColors(self.okhslSaturation.value(), 
+        if (not channels or channels == "okhsl") and "okhsl" in self.families:
+            self.okhslHue.updateGradientColors(self.okhslSaturation.value(),
                                                self.okhslLightness.value(), self.trc)
-            self.okhslSaturation.updateGradientColors(self.okhslHue.value(), 
+            self.okhslSaturation.updateGradientColors(self.okhslHue.value(),
                                                       self.okhslLightness.value(), self.trc)
-            self.okhslLightness.updateGradientColors(self.okhslHue.value(), 
+            self.okhslLightness.updateGradientColors(self.okhslHue.value(),
                                                      self.okhslSaturation.value(), self.trc)
 
     def setChannelValues(self, channels: str, rgb: tuple, hue: float=-1):
-        if channels == "hsv":
-            hsv = Convert.rgbFToHsv(*rgb, self.trc)
-            if hue != -1:
-                self.hsvHue.setValue(hue)
-            elif hsv[1] > 0:
-                self.hsvHue.setValue(hsv[0])
-            if hsv[2] > 0:
-                self.hsvSaturation.setValue(hsv[1])
-            self.hsvValue.setValue(hsv[2])
-        elif channels == "hsl":
-            hsl = Convert.rgbFToHsl(*rgb, self.trc)
-            if hue != -1:
-                self.hslHue.setValue(hue)
-            elif hsl[1] > 0:
-                self.hslHue.setValue(hsl[0])
-            if hsl[2] > 0:
-                self.hslSaturation.setValue(hsl[1])
-            self.hslLightness.setValue(hsl[2])
-        elif channels == "hcy":
-            self.hcyChroma.clip = 0.0
-            hcy = Convert.rgbFToHcy(*rgb, self.hcyHue.value(), self.trc, self.hcyLuma.luma)
-            if hue != -1:
-                self.hcyHue.setValue(hue)
-            elif hcy[1] > 0:
-                self.hcyHue.setValue(hcy[0])
-            # must always set limit before setting chroma value
-            self.hcyChroma.setLimit(hcy[3])
-            self.hcyChroma.setValue(hcy[1])
-            self.hcyLuma.setValue(hcy[2])
-        elif channels == "okhcl":
-            self.okhclChroma.clip = 0.0
-            okhcl = Convert.rgbFToOkhcl(*rgb, self.okhclHue.value(), self.trc)
-            if hue != -1:
-                self.okhclHue.setValue(hue)
-            else:
-                self.okhclHue.setValue(okhcl[0])
-            # must always set limit before setting chroma value
-            self.okhclChroma.setLimit(okhcl[3])
-            self.okhclChroma.setValue(okhcl[1])
-            self.okhclLightness.setValue(okhcl[2])
-        elif channels == "okhsv":
-            okhsv = Convert.rgbFToOkhsv(*rgb, self.trc)
-            if hue != -1:
-                self.okhsvHue.setValue(hue)
-            elif okhsv[1] > 0:
-                self.okhsvHue.setValue(okhsv[0])
-            if okhsv[2] > 0:
-                self.okhsvSaturation.setValue(okhsv[1])
-            self.okhsvValue.setValue(okhsv[2])
-        elif channels == "okhsl":
-            okhsl = Convert.rgbFToOkhsl(*rgb, self.trc)
-            if hue != -1:
-                self.okhslHue.setValue(hue)
-            elif okhsl[1] > 0:
-                self.okhslHue.setValue(okhsl[0])
-            if okhsl[2] > 0:
-                self.okhslSaturation.setValue(okhsl[1])
-            self.okhslLightness.setValue(okhsl[2])
+        # channels not displayed are skipped until displayChannels shows them
+        if channels not in self.families:
+            return
+        self.setters[channels](rgb, hue)
+
+    def setHsvValues(self, rgb: tuple, hue: float=-1):
+        hsv = Convert.rgbFToHsv(*rgb, self.trc)
+        if hue != -1:
+            self.hsvHue.setValue(hue)
+        elif hsv[1] > 0:
+            self.hsvHue.setValue(hsv[0])
+        if hsv[2] > 0:
+            self.hsvSaturation.setValue(hsv[1])
+        self.hsvValue.setValue(hsv[2])
+
+    def setHslValues(self, rgb: tuple, hue: float=-1):
+        hsl = Convert.rgbFToHsl(*rgb, self.trc)
+        if hue != -1:
+            self.hslHue.setValue(hue)
+        elif hsl[1] > 0:
+            self.hslHue.setValue(hsl[0])
+        if hsl[2] > 0:
+            self.hslSaturation.setValue(hsl[1])
+        self.hslLightness.setValue(hsl[2])
+
+    def setHcyValues(self, rgb: tuple, hue: float=-1):
+        self.hcyChroma.clip = 0.0
+        hcy = Convert.rgbFToHcy(*rgb, self.hcyHue.value(), self.trc, self.hcyLuma.luma)
+        if hue != -1:
+            self.hcyHue.setValue(hue)
+        elif hcy[1] > 0:
+            self.hcyHue.setValue(hcy[0])
+        # must always set limit before setting chroma value
+        self.hcyChroma.setLimit(hcy[3])
+        self.hcyChroma.setValue(hcy[1])
+        self.hcyLuma.setValue(hcy[2])
+
+    def setOkhclValues(self, rgb: tuple, hue: float=-1):
+        self.okhclChroma.clip = 0.0
+        okhcl = Convert.rgbFToOkhcl(*rgb, self.okhclHue.value(), self.trc)
+        if hue != -1:
+            self.okhclHue.setValue(hue)
+        else:
+            self.okhclHue.setValue(okhcl[0])
+        # must always set limit before setting chroma value
+        self.okhclChroma.setLimit(okhcl[3])
+        self.okhclChroma.setValue(okhcl[1])
+        self.okhclLightness.setValue(okhcl[2])
+
+    def setOkhsvValues(self, rgb: tuple, hue: float=-1):
+        okhsv = Convert.rgbFToOkhsv(*rgb, self.trc)
+        if hue != -1:
+            self.okhsvHue.setValue(hue)
+        elif okhsv[1] > 0:
+            self.okhsvHue.setValue(okhsv[0])
+        if okhsv[2] > 0:
+            self.okhsvSaturation.setValue(okhsv[1])
+        self.okhsvValue.setValue(okhsv[2])
+
+    def setOkhslValues(self, rgb: tuple, hue: float=-1):
+        okhsl = Convert.rgbFToOkhsl(*rgb, self.trc)
+        if hue != -1:
+            self.okhslHue.setValue(hue)
+        elif okhsl[1] > 0:
+            self.okhslHue.setValue(okhsl[0])
+        if okhsl[2] > 0:
+            self.okhslSaturation.setValue(okhsl[1])
+        self.okhslLightness.setValue(okhsl[2])
 
     def makeManagedColor(self, rgb: tuple, profile: str=None):
         model = "RGBA"
@@ -1567,22 +1726,17 @@ class HCLSliders(DockWidget):
                     break
 
         color = ManagedColor(model, depth, profile)
-        components = color.components()
         # support for other models in the future
         if model == "RGBA":
+            # rgba always has 4 components so they are set without reading them first
             # unordered sequence is BGRA for uint but RGBA for float 
             if depth[0] == "U":
-                components[0] = rgb[2]
-                components[1] = rgb[1]
-                components[2] = rgb[0]
+                color.setComponents([rgb[2], rgb[1], rgb[0], 1.0])
             else:
-                components[0] = rgb[0]
-                components[1] = rgb[1]
-                components[2] = rgb[2]
-            components[3] = 1.0
-            color.setComponents(components)
+                color.setComponents([rgb[0], rgb[1], rgb[2], 1.0])
             return color
         elif model == "A" or model == "GRAYA":
+            components = color.components()
             components[0] = rgb[0]
             components[1] = 1.0
             color.setComponents(components)
@@ -1612,18 +1766,18 @@ class HCLSliders(DockWidget):
         self.hcyLuma.luma = luma
 
         if self.color.current:
-            rgb = tuple(self.color.current.componentsOrdered()[:3])
+            rgb = self.colorRgb(self.color.current)
             trc = self.profileTRC(self.color.current.colorProfile())    
             if trc != self.trc:
                 rgb = Convert.rgbToTRC(rgb, self.trc)
-            if luma or self.trc == "sRGB":
+            if (luma or self.trc == "sRGB") and "hsv" in self.families:
                 self.setChannelValues("hcy", rgb, self.hsvHue.value())
             else:
                 self.setChannelValues("hcy", rgb)
             self.updateChannelGradients("hcy")
 
         self.blockChannels(False)
-        if TIME:
+        if TIME and self.isVisible():
             self.timer.start(TIME)
 
     def setHistory(self):
@@ -1633,9 +1787,7 @@ class HCLSliders(DockWidget):
             return
         
         current = self.color.current
-        rgb = tuple(current.componentsOrdered()[:3])
-        if current.colorModel() == "A" or current.colorModel() == "GRAYA":
-            rgb = (rgb[0], rgb[0], rgb[0])
+        rgb = self.colorRgb(current)
         profile = current.colorProfile()
         color = (rgb, profile)
         if color in self.pastColors:
@@ -1652,13 +1804,10 @@ class HCLSliders(DockWidget):
             item = QListWidgetItem()
             item.setIcon(QIcon(pixmap))
             self.history.insertItem(0, item)
-            if self.memory:
-                for i in reversed(range(self.history.count())):
-                    if i > self.memory - 1:
-                        self.history.takeItem(i)
-                        self.pastColors.pop()
-                    else:
-                        break
+            if self.memory and self.history.count() > self.memory:
+                # drop every color past memory at once, many after memory is lowered
+                self.history.model().removeRows(self.memory, self.history.count() - self.memory)
+                del self.pastColors[self.memory:]
         self.history.horizontalScrollBar().setValue(0)
 
     def setPastColor(self, index: int, fg=True):
@@ -1698,16 +1847,14 @@ class HCLSliders(DockWidget):
 
     def clearHistory(self):
         self.history.clear()
+        self.history.colors = {}
         self.pastColors = []
     
     def updateSyntax(self, rgb: tuple, trc: str):
-        if self.notation == NOTATION[0]:
-            self.text = Convert.rgbFToHexS(*rgb, trc)
-        elif self.notation == NOTATION[1]:
-            self.text = Convert.rgbFToOklabS(*rgb, trc)
-        elif self.notation == NOTATION[2]:
-            self.text = Convert.rgbFToOklchS(*rgb, trc)
-        self.syntax.setText(self.text)
+        self.text = SYNTAX_FORMAT[self.notation](*rgb, trc)
+        # nearby colors often share the same syntax, e.g. hex while dragging
+        if self.syntax.text() != self.text:
+            self.syntax.setText(self.text)
 
     def switchNotation(self):
         view = Application.activeWindow().activeView()
@@ -1719,7 +1866,7 @@ class HCLSliders(DockWidget):
         self.updateNotations()
         color = view.foregroundColor()
         trc = self.profileTRC(color.colorProfile())
-        self.updateSyntax(color.componentsOrdered()[:3], trc)
+        self.updateSyntax(self.colorRgb(color), trc)
 
     def setNotation(self, notation: str):
         self.notation = notation
@@ -1727,16 +1874,10 @@ class HCLSliders(DockWidget):
         Application.writeSetting(DOCKER_NAME, "syntax", ",".join(["True", notation]))
 
     def updateNotations(self):
+        # neighbours wrap around, index -1 is already the last notation
         i = NOTATION.index(self.notation)
-        if i == 0:
-            self.prevNotation.setToolTip(NOTATION[len(NOTATION) - 1])
-            self.nextNotation.setToolTip(NOTATION[i + 1])
-        elif i == len(NOTATION) - 1:
-            self.prevNotation.setToolTip(NOTATION[i - 1])
-            self.nextNotation.setToolTip(NOTATION[0])
-        else:
-            self.prevNotation.setToolTip(NOTATION[i - 1])
-            self.nextNotation.setToolTip(NOTATION[i + 1])
+        self.prevNotation.setToolTip(NOTATION[i - 1])
+        self.nextNotation.setToolTip(NOTATION[(i + 1) % len(NOTATION)])
 
     def parseSyntax(self):
         view = Application.activeWindow().activeView()
@@ -1748,15 +1889,11 @@ class HCLSliders(DockWidget):
 
         rgb = None
         notation = self.notation
-        if syntax[:1] == "#":
-            self.setNotation(NOTATION[0])
-            rgb = Convert.hexSToRgbF(syntax, self.trc)
-        elif syntax[:5].upper() == NOTATION[1]:
-            self.setNotation(NOTATION[1])
-            rgb = Convert.oklabSToRgbF(syntax, self.trc)
-        elif syntax[:5].upper() == NOTATION[2]:
-            self.setNotation(NOTATION[2])
-            rgb = Convert.oklchSToRgbF(syntax, self.trc)
+        prefix = "#" if syntax[:1] == "#" else syntax[:5].upper()
+        if prefix in SYNTAX_PARSE:
+            parsed, parse = SYNTAX_PARSE[prefix]
+            self.setNotation(parsed)
+            rgb = parse(syntax, self.trc)
         
         if notation != self.notation:
             self.updateNotations()
@@ -1766,12 +1903,16 @@ class HCLSliders(DockWidget):
         else:
             color = view.foregroundColor()
             trc = self.profileTRC(color.colorProfile())
-            self.updateSyntax(color.componentsOrdered()[:3], trc)    
+            self.updateSyntax(self.colorRgb(color), trc)    
     
     def showEvent(self, event):
         if TIME:
             self.timer.start(TIME)
 
+    def hideEvent(self, event):
+        # stop polling krita while the docker cannot be seen, e.g. behind another tab
+        self.timer.stop()
+
     def closeEvent(self, event):
         self.timer.stop()
 